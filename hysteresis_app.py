@@ -6,11 +6,12 @@
 
 import tkinter as tk
 import logging
+import logging.handlers
+import queue
+import atexit
 from datetime import datetime
 import os
 import sys
-import matplotlib
-import utils_visualization as uv
 from tkinter import messagebox
 
 # 导入自定义模块
@@ -19,21 +20,38 @@ from hysteresis_controller import HysteresisController
 
 # 设置日志
 def setup_logging():
-    """设置日志记录"""
+    """设置日志记录
+    
+    界面线程只将日志记录放入队列，由后台监听线程输出；
+    文件日志经内存缓冲批量写入，遇到ERROR级别或程序退出时刷新
+    """
     log_dir = "logs"
     os.makedirs(log_dir, exist_ok=True)
     
     log_file = os.path.join(log_dir, f"hysteresis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
     
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler(log_file)
-        ]
+    # 延迟打开日志文件，并缓冲512条记录后批量写入
+    file_handler = logging.FileHandler(log_file, delay=True)
+    file_handler.setFormatter(formatter)
+    memory_handler = logging.handlers.MemoryHandler(
+        512, flushLevel=logging.ERROR, target=file_handler
     )
     
+    # 后台线程从队列中取出记录并交给实际的处理器
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, stream_handler, memory_handler)
+    listener.start()
+    # 退出时先停止监听线程，剩余缓冲由logging.shutdown刷新
+    atexit.register(listener.stop)
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
     return logging.getLogger(__name__)
 
 def create_menu(root, controller):
@@ -121,9 +139,6 @@ def main():
     logger.info("程序启动")
     
     try:
-        # 设置中文字体
-        uv.set_chinese_font()
-        
         # 创建主窗口
         root = tk.Tk()
         root.title("准静态试验滞回曲线分析工具")
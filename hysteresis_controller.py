@@ -6,18 +6,18 @@
 
 import logging
 import os
-import numpy as np
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import filedialog, messagebox
-from hysteresis_data import HysteresisData
-from hysteresis_viz import HysteresisViz
-import utils_data as ud
+from hysteresis_gui import _safe_int
 
 logger = logging.getLogger(__name__)
 
 class HysteresisController:
     """滞回曲线分析控制器"""
     
+    # 数据点数超过该值时，传给绘图的数据转换为float32
+    PLOT_FLOAT32_THRESHOLD = 200_000
+    
     def __init__(self, gui):
         """初始化控制器
         
@@ -26,8 +26,33 @@ class HysteresisController:
         """
         logger.info("初始化控制器")
         self.gui = gui
-        self.data = HysteresisData()
-        self.viz = HysteresisViz(gui.fig, gui.canvas, gui.result_text)
+        
+        # 数据处理器和可视化管理器在首次使用时创建，避免启动时导入pandas等模块
+        self._data = None
+        self._viz = None
+        
+        # 后台预取相邻文件的线程池
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1)
+        
+        # 处理参数缓存，界面参数修改时失效
+        self._params = None
+        self.gui.peak_prominence_var.trace_add("write", self._invalidate_params)
+        self.gui.cycle_count_var.trace_add("write", self._invalidate_params)
+        
+        # 单位设置缓存，单位修改时失效
+        self._unit_cache = None
+        self.gui.disp_unit_var.trace_add("write", self._invalidate_units)
+        self.gui.force_unit_var.trace_add("write", self._invalidate_units)
+        
+        # 正在进行的批量处理任务，完成前不允许再次启动
+        self._batch = None
+        
+        # 跳过行数输入停止300毫秒后自动应用，避免每次按键都重新读取文件
+        self._skiprows_after = None
+        self.gui.skiprows_var.trace_add("write", self._debounced_apply_skiprows)
+        
+        # 上次打开的目录，文件对话框从该目录开始
+        self._last_dir = None
         
         # 将GUI的控制器设置为本控制器
         self.gui.controller = self
@@ -41,14 +66,66 @@ class HysteresisController:
         
         logger.info("控制器初始化完成")
     
+    @property
+    def data(self):
+        """数据处理器，首次访问时导入数据处理模块"""
+        if self._data is None:
+            from hysteresis_data import HysteresisData
+            self._data = HysteresisData()
+        return self._data
+    
+    @property
+    def viz(self):
+        """可视化管理器，首次绘图时导入可视化模块"""
+        if self._viz is None:
+            import utils_visualization as uv
+            from hysteresis_viz import HysteresisViz
+            # 中文字体随可视化模块一起延迟设置，不拖慢窗口启动
+            uv.set_chinese_font()
+            self._viz = HysteresisViz(self.gui.fig, self.gui.canvas, self.gui)
+        return self._viz
+    
+    def _invalidate_params(self, *args):
+        """处理参数变量被修改时清除缓存"""
+        self._params = None
+    
+    def _get_params(self):
+        """获取转换后的处理参数，结果缓存至参数被修改
+        
+        返回:
+            dict: {'peak_prominence': float, 'cycle_count': int}
+        """
+        if self._params is None:
+            self._params = {
+                'peak_prominence': float(self.gui.peak_prominence_var.get()),
+                'cycle_count': int(self.gui.cycle_count_var.get())
+            }
+        return self._params
+    
+    def _invalidate_units(self, *args):
+        """单位变量被修改时清除缓存"""
+        self._unit_cache = None
+    
+    def _units(self):
+        """获取当前的位移和力单位
+        
+        返回:
+            tuple: (disp_unit, force_unit)
+        """
+        if self._unit_cache is None:
+            self._unit_cache = (self.gui.disp_unit_var.get(), self.gui.force_unit_var.get())
+        return self._unit_cache
+    
     def load_file(self):
         """加载单个文件"""
         try:
             logger.info("开始选择单个文件")
             # 弹出文件选择对话框
             file_path = filedialog.askopenfilename(
+                parent=self.gui.master,
+                initialdir=self._last_dir,
                 title="选择数据文件",
-                filetypes=[("Excel文件", "*.xlsx"), ("Excel文件", "*.xls"), ("所有文件", "*.*")]
+                filetypes=[("Excel文件", "*.xlsx *.xlsm *.xlsb *.xls"), ("OpenDocument表格", "*.ods"), ("所有文件", "*.*")]
             )
             
             if not file_path:
@@ -56,16 +133,17 @@ class HysteresisController:
                 return
                 
             logger.info(f"选择的文件: {file_path}")
+            self._last_dir = os.path.dirname(file_path)
             
             # 获取跳过行数
             skiprows = int(self.gui.skiprows_var.get() or 0)
             
             # 加载文件
-            success, message = self.data.load_file(file_path, skiprows)
+            success, message = self.data.load_file(file_path, skiprows, channels=self._load_channels())
             
             if success:
                 # 更新文件信息
-                current_file = os.path.basename(self.data.file_path)
+                current_file = self.data.file_name
                 self.gui.update_file_info(f"当前文件: {current_file}\n路径: {self.data.file_path}")
                 
                 # 隐藏文件导航按钮
@@ -73,9 +151,9 @@ class HysteresisController:
                 
                 # 更新通道选项
                 if self.data.data is not None:
-                    self.gui.update_channel_options(list(self.data.data.columns))
+                    self.gui.update_channel_options(self.data.columns)
                 
-                messagebox.showinfo("成功", message)
+                self.gui.set_status(message)
             else:
                 messagebox.showerror("错误", message)
         
@@ -89,39 +167,34 @@ class HysteresisController:
             logger.info("开始选择多个文件")
             # 弹出文件选择对话框
             file_paths = filedialog.askopenfilenames(
+                parent=self.gui.master,
+                initialdir=self._last_dir,
                 title="选择多个数据文件",
-                filetypes=[("Excel文件", "*.xlsx"), ("Excel文件", "*.xls"), ("所有文件", "*.*")]
+                filetypes=[("Excel文件", "*.xlsx *.xlsm *.xlsb *.xls"), ("OpenDocument表格", "*.ods"), ("所有文件", "*.*")]
             )
             
             if not file_paths:
                 logger.info("用户取消了文件选择")
                 return
-                
-            logger.info(f"文件选择对话框返回值类型: {type(file_paths)}")
-            logger.info(f"文件选择对话框返回值: {file_paths}")
-            
-            # 将tuple转换为list
-            if isinstance(file_paths, tuple):
-                file_paths = list(file_paths)
-                logger.info(f"将非字符串对象转换为列表，转换后长度: {len(file_paths)}")
             
+            self._last_dir = os.path.dirname(file_paths[0])
+                
             # 获取当前的skiprows设置
             skiprows = int(self.gui.skiprows_var.get() or 0)
             
             # 加载多个文件
-            success, message = self.data.load_multiple_files(file_paths, skiprows)
+            success, message = self.data.load_multiple_files(
+                file_paths, skiprows, preload_all=True, channels=self._load_channels()
+            )
             
             logger.info(f"load_multiple_files返回: 成功={success}, 消息={message}")
             
             if success:
                 # 更新文件信息
-                current_file = os.path.basename(self.data.file_path)
-                self.gui.update_file_info(
-                    f"当前文件: {current_file} ({self.data.current_file_index + 1}/{len(self.data.file_paths)})\n"
-                    f"路径: {self.data.file_path}"
-                )
+                file_info = self._format_file_info()
+                self.gui.update_file_info(file_info)
                 
-                logger.info(f"当前文件: {current_file}, 索引: {self.data.current_file_index + 1}/{len(self.data.file_paths)}")
+                logger.info(file_info)
                 
                 # 显示文件导航按钮
                 logger.info("显示文件导航按钮")
@@ -129,10 +202,9 @@ class HysteresisController:
                 
                 # 更新通道选项
                 if self.data.data is not None:
-                    logger.info(f"更新通道选项: {list(self.data.data.columns)}")
-                    self.gui.update_channel_options(list(self.data.data.columns))
+                    self.gui.update_channel_options(self.data.columns)
                 
-                messagebox.showinfo("成功", message)
+                self.gui.set_status(message)
             else:
                 messagebox.showerror("错误", message)
         
@@ -145,13 +217,18 @@ class HysteresisController:
         try:
             logger.info("开始选择文件夹")
             # 打开文件夹选择对话框
-            folder_path = filedialog.askdirectory(title="选择数据文件夹")
+            folder_path = filedialog.askdirectory(
+                parent=self.gui.master,
+                initialdir=self._last_dir,
+                title="选择数据文件夹"
+            )
             
             if not folder_path:
                 logger.info("用户取消了文件夹选择")
                 return  # 用户取消了选择
                 
             logger.info(f"选择的文件夹: {folder_path}")
+            self._last_dir = folder_path
             
             # 获取当前的skiprows设置
             skiprows = int(self.gui.skiprows_var.get() or 0)
@@ -160,25 +237,24 @@ class HysteresisController:
             # 更新data对象的skiprows值
             self.data.skiprows = skiprows
             
+            # 获取并行读取进程数，为空或0时自动确定
+            max_workers = _safe_int(self.gui.workers_var, 0) or None
+            
             # 加载文件夹
-            success, message = self.data.load_folder(folder_path)
+            success, message = self.data.load_folder(folder_path, max_workers=max_workers)
             
             if success:
                 # 更新文件信息
-                current_file = os.path.basename(self.data.file_path)
-                self.gui.update_file_info(
-                    f"当前文件: {current_file} ({self.data.current_file_index + 1}/{len(self.data.file_paths)})\n"
-                    f"路径: {self.data.file_path}"
-                )
+                self.gui.update_file_info(self._format_file_info())
                 
                 # 显示文件导航按钮
                 self.gui.show_file_navigation(True)
                 
                 # 更新通道选项
                 if self.data.data is not None:
-                    self.gui.update_channel_options(list(self.data.data.columns))
+                    self.gui.update_channel_options(self.data.columns)
                 
-                messagebox.showinfo("成功", message)
+                self.gui.set_status(message)
             else:
                 messagebox.showerror("错误", message)
         
@@ -186,37 +262,77 @@ class HysteresisController:
             logger.error(f"加载文件夹出错: {str(e)}", exc_info=True)
             messagebox.showerror("错误", f"加载文件夹出错: {str(e)}")
     
+    def _format_file_info(self):
+        """生成多文件模式下当前文件的显示信息
+        
+        返回:
+            str: 文件信息文本
+        """
+        index = self.data.current_file_index
+        file_names = self.data.file_names
+        return (f"当前文件: {file_names[index]} ({index + 1}/{len(file_names)})\n"
+                f"路径: {self.data.file_path}")
+    
+    def _plot_arrays(self, *arrays):
+        """数据量较大时将绘图数据转换为float32，减少绘图时的内存读写
+        
+        返回:
+            tuple: 转换后的数组
+        """
+        if len(arrays[0]) > self.PLOT_FLOAT32_THRESHOLD:
+            return tuple(a.astype("float32", copy=False) for a in arrays)
+        return arrays
+    
+    def _load_channels(self):
+        """获取加载文件时只读取的通道
+        
+        返回:
+            list: 勾选"只读取所选通道"且已选择位移和力通道时返回所选通道，否则返回None
+        """
+        if not self.gui.selected_only_var.get():
+            return None
+        channels = [self.gui.disp_channel_var.get(), self.gui.force1_channel_var.get(),
+                    self.gui.force2_channel_var.get()]
+        if not channels[0] or not channels[1]:
+            return None
+        return channels
+    
+    def _prefetch_neighbors(self):
+        """在后台预取当前文件前后相邻的文件"""
+        index = self.data.current_file_index
+        file_paths = self.data.file_paths
+        for neighbor in (index + 1, index - 1):
+            if 0 <= neighbor < len(file_paths):
+                self._prefetch_pool.submit(self.data.prefetch_file, file_paths[neighbor])
+    
     def prev_file(self):
         """切换到上一个文件"""
         try:
-            logger.info("尝试切换到上一个文件")
             if not hasattr(self.data, 'file_paths') or not self.data.file_paths:
                 logger.warning("没有加载多个文件")
                 messagebox.showinfo("提示", "没有加载多个文件")
                 return
                 
             if self.data.current_file_index > 0:
-                old_index = self.data.current_file_index
-                logger.debug(f"当前文件索引: {old_index + 1}/{len(self.data.file_paths)}，切换到索引: {old_index}")
                 self.data.current_file_index -= 1
                 success, message = self.data.load_current_file()
                 
                 if success:
                     # 更新文件信息
-                    current_file = os.path.basename(self.data.file_path)
-                    total_files = len(self.data.file_paths)
-                    current_index = self.data.current_file_index + 1
-                    self.gui.update_file_info(
-                        f"当前文件: {current_file} ({current_index}/{total_files})\n"
-                        f"路径: {self.data.file_path}"
-                    )
+                    file_info = self._format_file_info()
+                    self.gui.update_file_info(file_info)
                     
                     # 更新通道选项
                     if self.data.data is not None:
-                        columns = list(self.data.data.columns)
-                        self.gui.update_channel_options(columns)
-                        
-                    logger.info(f"切换到上一个文件: {current_file}, 索引: {current_index}/{total_files}")
+                        self.gui.update_channel_options(self.data.columns)
+                    
+                    if logger.isEnabledFor(logging.INFO):
+                        index = self.data.current_file_index
+                        logger.info("切换到%s文件 -> %d/%d (%s)", "上一个", index + 1,
+                                    len(self.data.file_paths), self.data.file_names[index])
+                    
+                    # 预取相邻文件
+                    self._prefetch_neighbors()
                 else:
                     logger.error(f"加载上一个文件失败: {message}")
                     messagebox.showerror("错误", f"加载文件失败: {message}")
@@ -231,34 +347,31 @@ class HysteresisController:
     def next_file(self):
         """切换到下一个文件"""
         try:
-            logger.info("尝试切换到下一个文件")
             if not hasattr(self.data, 'file_paths') or not self.data.file_paths:
                 logger.warning("没有加载多个文件")
                 messagebox.showinfo("提示", "没有加载多个文件")
                 return
                 
             if self.data.current_file_index < len(self.data.file_paths) - 1:
-                old_index = self.data.current_file_index
-                logger.debug(f"当前文件索引: {old_index + 1}/{len(self.data.file_paths)}，切换到索引: {old_index + 2}")
                 self.data.current_file_index += 1
                 success, message = self.data.load_current_file()
                 
                 if success:
                     # 更新文件信息
-                    current_file = os.path.basename(self.data.file_path)
-                    total_files = len(self.data.file_paths)
-                    current_index = self.data.current_file_index + 1
-                    self.gui.update_file_info(
-                        f"当前文件: {current_file} ({current_index}/{total_files})\n"
-                        f"路径: {self.data.file_path}"
-                    )
+                    file_info = self._format_file_info()
+                    self.gui.update_file_info(file_info)
                     
                     # 更新通道选项
                     if self.data.data is not None:
-                        columns = list(self.data.data.columns)
-                        self.gui.update_channel_options(columns)
-                        
-                    logger.info(f"切换到下一个文件: {current_file}, 索引: {current_index}/{total_files}")
+                        self.gui.update_channel_options(self.data.columns)
+                    
+                    if logger.isEnabledFor(logging.INFO):
+                        index = self.data.current_file_index
+                        logger.info("切换到%s文件 -> %d/%d (%s)", "下一个", index + 1,
+                                    len(self.data.file_paths), self.data.file_names[index])
+                    
+                    # 预取相邻文件
+                    self._prefetch_neighbors()
                 else:
                     logger.error(f"加载下一个文件失败: {message}")
                     messagebox.showerror("错误", f"加载文件失败: {message}")
@@ -270,29 +383,57 @@ class HysteresisController:
             logger.error(f"切换到下一个文件出错: {str(e)}", exc_info=True)
             messagebox.showerror("错误", f"切换到下一个文件出错: {str(e)}")
     
+    def _debounced_apply_skiprows(self, *args):
+        """跳过行数变量被修改时，取消尚未执行的应用并重新计时"""
+        if self._skiprows_after is not None:
+            self.gui.master.after_cancel(self._skiprows_after)
+        self._skiprows_after = self.gui.master.after(300, self._auto_apply_skiprows)
+    
+    def _auto_apply_skiprows(self):
+        """输入停止后自动应用跳过行设置，输入不完整或未加载文件时忽略"""
+        self._skiprows_after = None
+        if self._data is None or self._data.data is None:
+            return
+        if not self.gui.skiprows_var.get().strip().isdigit():
+            return
+        self.apply_skiprows()
+    
     def apply_skiprows(self):
         """应用跳过行设置"""
+        if self._skiprows_after is not None:
+            self.gui.master.after_cancel(self._skiprows_after)
+            self._skiprows_after = None
+        
         try:
             skiprows = int(self.gui.skiprows_var.get() or 0)
             logger.info(f"应用跳过行设置: {skiprows}")
-            
+
+            # 跳过行数未变化时无需重新读取文件
+            if skiprows == self.data.skiprows and self.data.data is not None:
+                self.gui.set_status(f"跳过行数未变化: {skiprows}")
+                return
+
             if self.data.file_path:
-                # 如果已经加载了文件，则重新加载当前文件
-                success, message = self.data.load_file(self.data.file_path, skiprows)
+                # 如果已经加载了文件，则只重新加载当前文件，保留多文件列表和当前位置
+                previous_skiprows = self.data.skiprows
+                self.data.skiprows = skiprows
+                success, message = self.data.load_current_file()
+                
+                if not success:
+                    self.data.skiprows = previous_skiprows
                 
                 if success:
-                    messagebox.showinfo("成功", f"已应用跳过行设置: {skiprows}")
+                    self.gui.set_status(f"已应用跳过行设置: {skiprows}")
                     
                     # 更新通道选项
                     if self.data.data is not None:
-                        columns = list(self.data.data.columns)
-                        self.gui.update_channel_options(columns)
+                        self.gui.update_channel_options(self.data.columns)
                 else:
                     messagebox.showerror("错误", message)
             else:
                 # 如果还没有加载文件，则只更新设置
                 self.data.skiprows = skiprows
-                messagebox.showinfo("提示", f"已设置跳过行数: {skiprows}")
+                self.gui.set_status(f"已设置跳过行数: {skiprows}")
                 
         except ValueError:
             logger.error("跳过行数必须为整数")
@@ -304,10 +445,23 @@ class HysteresisController:
     def update_units(self):
         """更新单位设置"""
         # 获取单位设置
-        disp_unit = self.gui.disp_unit_var.get()
-        force_unit = self.gui.force_unit_var.get()
+        disp_unit, force_unit = self._units()
         logger.info(f"更新单位设置: 位移={disp_unit}, 力={force_unit}")
     
+    def _reload_selected_columns(self, disp_channel, force1_channel, force2_channel):
+        """记录所选通道，当前数据缺少所选列时按所选列重新读取
+        
+        返回:
+            bool: 是否成功
+        """
+        success, message = self.data.set_selected_channels([disp_channel, force1_channel, force2_channel])
+        if not success:
+            logger.error(f"读取所选通道失败: {message}")
+            messagebox.showerror("错误", message)
+        elif message:
+            logger.info(message)
+        return success
+    
     def draw_raw_hysteresis(self):
         """绘制原始滞回曲线"""
         try:
@@ -329,6 +483,10 @@ class HysteresisController:
                 
             logger.info(f"选择的通道: 位移={disp_channel}, 力1={force1_channel}, 力2={force2_channel}")
             
+            # 记录所选通道，后续加载文件时只读取这些列
+            if not self._reload_selected_columns(disp_channel, force1_channel, force2_channel):
+                return
+            
             # 设置通道
             success, message = self.data.set_channels(disp_channel, force1_channel, force2_channel)
             
@@ -338,12 +496,12 @@ class HysteresisController:
                 return
                 
             # 绘制原始滞回曲线
-            disp_unit = self.gui.disp_unit_var.get()
-            force_unit = self.gui.force_unit_var.get()
+            disp_unit, force_unit = self._units()
+            displacement, force = self._plot_arrays(self.data.raw_displacement, self.data.raw_force)
             
             self.viz.draw_raw_hysteresis(
-                self.data.raw_displacement, 
-                self.data.raw_force,
+                displacement,
+                force,
                 disp_unit=disp_unit,
                 force_unit=force_unit
             )
@@ -372,8 +530,9 @@ class HysteresisController:
                 return False
                 
             # 获取处理参数
-            peak_prominence = float(self.gui.peak_prominence_var.get())
-            cycle_count = int(self.gui.cycle_count_var.get())
+            params = self._get_params()
+            peak_prominence = params['peak_prominence']
+            cycle_count = params['cycle_count']
             
             # 处理数据并识别循环
             success_process, message_process = self.data.process_data()
@@ -389,12 +548,12 @@ class HysteresisController:
             )
             
             # 绘制处理后的滞回曲线和识别的循环
-            disp_unit = self.gui.disp_unit_var.get()
-            force_unit = self.gui.force_unit_var.get()
+            disp_unit, force_unit = self._units()
+            displacement, force = self._plot_arrays(self.data.processed_displacement, self.data.processed_force)
             
             self.viz.draw_processed_hysteresis_with_cycles(
-                self.data.processed_displacement,
-                self.data.processed_force,
+                displacement,
+                force,
                 self.data.cycles,
                 self.data.cycle_peaks,
                 self.data.cycle_valleys,
@@ -403,7 +562,7 @@ class HysteresisController:
             )
             
             if not silent and success_cycles:
-                messagebox.showinfo("成功", message_cycles)
+                self.gui.set_status(message_cycles)
             
             logger.info("数据处理完成")
             return success_cycles
@@ -434,8 +593,7 @@ class HysteresisController:
                 return
                 
             # 获取单位
-            disp_unit = self.gui.disp_unit_var.get()
-            force_unit = self.gui.force_unit_var.get()
+            disp_unit, force_unit = self._units()
             
             # 显示等效刚度结果
             self.viz.show_equivalent_stiffness_results(
@@ -468,14 +626,14 @@ class HysteresisController:
                 return
                 
             # 获取文件名作为工况名
-            name = os.path.splitext(os.path.basename(self.data.file_path))[0]
+            name = self.data.file_stem
             
             # 使用第一个循环作为工况数据
             success, message = self.data.add_workcase(name=name, cycle_index=0)
             
             if success:
                 logger.info(f"成功添加工况: {name}")
-                messagebox.showinfo("成功", message)
+                self.gui.set_status(message)
             else:
                 logger.error(f"添加工况失败: {message}")
                 messagebox.showerror("错误", message)
@@ -502,7 +660,7 @@ class HysteresisController:
                 
                 if success:
                     logger.info("成功清除工况数据")
-                    messagebox.showinfo("成功", message)
+                    self.gui.set_status(message)
                 else:
                     logger.error(f"清除工况数据失败: {message}")
                     messagebox.showerror("错误", message)
@@ -521,7 +679,7 @@ class HysteresisController:
             if not self.data.workcases:
                 logger.warning("没有工况数据")
                 # 如果没有工况数据，尝试添加当前工况
-                current_file = os.path.basename(self.data.file_path) if self.data.file_path else "未知文件"
+                current_file = self.data.file_name or "未知文件"
                 result = messagebox.askyesno(
                     "提示", 
                     f"没有工况数据。是否要添加当前数据 ({current_file}) 作为工况？"
@@ -546,8 +704,7 @@ class HysteresisController:
                 return
                 
             # 获取单位
-            disp_unit = self.gui.disp_unit_var.get()
-            force_unit = self.gui.force_unit_var.get()
+            disp_unit, force_unit = self._units()
             
             # 绘制骨架曲线
             self.viz.draw_skeleton_curve(
@@ -558,7 +715,7 @@ class HysteresisController:
             )
             
             logger.info("生成骨架曲线完成")
-            messagebox.showinfo("成功", message)
+            self.gui.set_status(message)
             
         except Exception as e:
             logger.error(f"生成骨架曲线出错: {str(e)}", exc_info=True)
@@ -582,8 +739,7 @@ class HysteresisController:
                 return
                 
             # 获取单位
-            disp_unit = self.gui.disp_unit_var.get()
-            force_unit = self.gui.force_unit_var.get()
+            disp_unit, force_unit = self._units()
             
             # 绘制多工况骨架曲线
             self.viz.draw_multi_workcase_skeleton(
@@ -594,12 +750,107 @@ class HysteresisController:
             )
             
             logger.info("生成多工况骨架曲线完成")
-            messagebox.showinfo("成功", message)
+            self.gui.set_status(message)
             
         except Exception as e:
             logger.error(f"生成多工况骨架曲线出错: {str(e)}", exc_info=True)
             messagebox.showerror("错误", f"生成多工况骨架曲线出错: {str(e)}")
     
+    def batch_process_all(self):
+        """批量处理所有已加载的文件，并将结果添加为工况"""
+        try:
+            logger.info("开始批量处理文件")
+            if not self.data.file_paths:
+                logger.warning("未加载文件")
+                messagebox.showinfo("提示", "请先加载数据文件")
+                return
+            
+            # 获取通道设置
+            disp_channel = self.gui.disp_channel_var.get()
+            force1_channel = self.gui.force1_channel_var.get()
+            force2_channel = self.gui.force2_channel_var.get() or None
+            
+            if not disp_channel or not force1_channel:
+                logger.warning("未设置通道")
+                messagebox.showinfo("提示", "请先选择位移和力通道")
+                return
+            
+            if self._batch is not None:
+                messagebox.showinfo("提示", "批量处理正在进行，请等待完成")
+                return
+            
+            # 获取处理参数
+            params = self._get_params()
+            
+            # 读取和循环识别在进程池中执行，此处只提交任务，由_poll_batch在界面线程中收集结果
+            file_paths = list(self.data.file_paths)
+            futures, parameters = self.data.start_batch(
+                file_paths,
+                disp_channel,
+                force1_channel,
+                force2_channel,
+                cycle_count=params['cycle_count'],
+                peak_prominence=params['peak_prominence']
+            )
+            self._batch = {
+                'file_paths': file_paths,
+                'futures': futures,
+                'parameters': parameters,
+                'next': 0,
+                'succeeded': 0,
+                'failed': []
+            }
+            self.gui.set_status(f"批量处理中: 0/{len(file_paths)}")
+            self.gui.master.after(100, self._poll_batch)
+        
+        except Exception as e:
+            self._batch = None
+            logger.error(f"批量处理文件出错: {str(e)}", exc_info=True)
+            messagebox.showerror("错误", f"批量处理文件出错: {str(e)}")
+    
+    def _poll_batch(self):
+        """收集已完成的批量处理结果并添加为工况，未全部完成时继续定时检查
+        
+        按文件顺序添加，前面的文件未完成时后面已完成的结果暂不添加，保证工况编号与文件顺序一致
+        """
+        batch = self._batch
+        if batch is None:
+            return
+        
+        try:
+            futures = batch['futures']
+            while batch['next'] < len(futures) and futures[batch['next']].done():
+                index = batch['next']
+                batch['next'] += 1
+                file_path = batch['file_paths'][index]
+                success, _ = self.data.add_batch_result(file_path, futures[index], batch['parameters'])
+                if success:
+                    batch['succeeded'] += 1
+                else:
+                    batch['failed'].append(os.path.basename(file_path))
+        except Exception as e:
+            self._batch = None
+            logger.error(f"批量处理文件出错: {str(e)}", exc_info=True)
+            messagebox.showerror("错误", f"批量处理文件出错: {str(e)}")
+            return
+        
+        if batch['next'] < len(futures):
+            self.gui.set_status(f"批量处理中: {batch['next']}/{len(futures)}")
+            self.gui.master.after(100, self._poll_batch)
+            return
+        
+        self._batch = None
+        failed = batch['failed']
+        message = f"批量处理完成: 成功 {batch['succeeded']} 个, 失败 {len(failed)} 个"
+        if failed:
+            message += f"\n失败文件: {', '.join(failed)}"
+        logger.info(message)
+        
+        if batch['succeeded']:
+            self.gui.set_status(message)
+        else:
+            messagebox.showerror("错误", message)
+    
     def export_results(self):
         """导出分析结果"""
         try:
@@ -611,6 +862,8 @@ class HysteresisController:
                 
             # 弹出文件保存对话框
             file_path = filedialog.asksaveasfilename(
+                parent=self.gui.master,
+                initialdir=self._last_dir,
                 title="保存分析结果",
                 defaultextension=".xlsx",
                 filetypes=[("Excel文件", "*.xlsx"), ("所有文件", "*.*")]
@@ -625,7 +878,7 @@ class HysteresisController:
             
             if success:
                 logger.info(f"成功导出结果到: {file_path}")
-                messagebox.showinfo("成功", message)
+                self.gui.set_status(message)
             else:
                 logger.error(f"导出结果失败: {message}")
                 messagebox.showerror("错误", message)
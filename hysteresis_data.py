@@ -8,11 +8,186 @@ import os
 import pandas as pd
 import numpy as np
 import logging
-import glob
+import fnmatch
+import threading
+import tempfile
+import shutil
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import utils_data as ud
 
 logger = logging.getLogger(__name__)
 
+def _fast_clone(obj):
+    """复制工况数据，替代copy.deepcopy
+    
+    只读数组直接共享，可写数组使用ndarray.copy()，元组、列表和字典逐项复制，
+    其他对象视为不可变对象直接返回
+    
+    参数:
+        obj: 要复制的对象
+        
+    返回:
+        复制后的对象
+    """
+    if isinstance(obj, np.ndarray):
+        return obj if not obj.flags.writeable else obj.copy()
+    if isinstance(obj, tuple):
+        return tuple(_fast_clone(v) for v in obj)
+    if isinstance(obj, list):
+        return [_fast_clone(v) for v in obj]
+    if isinstance(obj, dict):
+        return {k: _fast_clone(v) for k, v in obj.items()}
+    return obj
+
+# 峰值点数达到此值时按位移分箱去重，避免逐点二分查找
+UNIQUE_BIN_MIN_POINTS = 50_000
+
+def _envelope_points(disp, force, displacement_threshold=0.001):
+    """由峰值点生成骨架曲线点：加入原点，按位移排序并去除过于接近的点
+    
+    点数较多时改为按阈值将位移量化到整数箱，每箱保留首个点
+    
+    参数:
+        disp: 峰值点位移数组
+        force: 峰值点力数组
+        displacement_threshold: 位移差值阈值，小于此值的点会被视为重复点
+        
+    返回:
+        tuple: (skeleton_disp, skeleton_force)
+    """
+    d = np.concatenate(([0.0], disp))
+    f = np.concatenate(([0.0], force))
+    
+    if len(d) >= UNIQUE_BIN_MIN_POINTS and displacement_threshold > 0:
+        # np.unique按箱号升序返回每箱首次出现的位置，原点位于首位因而得以保留
+        bins = np.round(d / displacement_threshold).astype(np.int64)
+        _, idx = np.unique(bins, return_index=True)
+        return d[idx], f[idx]
+    
+    # 按照位移值从小到大排序所有峰值点
+    order = np.argsort(d, kind='stable')
+    d, f = d[order], f[order]
+    
+    # 去除重复和过于接近的点：从已保留的点出发，用二分查找定位
+    # 第一个与其位移差不小于阈值的点，只需对保留的点循环
+    keep = np.empty(len(d), dtype=np.intp)
+    kept = 0
+    i = 0
+    while i < len(d):
+        keep[kept] = i
+        kept += 1
+        i = max(i + 1, int(np.searchsorted(d, d[i] + displacement_threshold, side='left')))
+    keep = keep[:kept]
+    return d[keep], f[keep]
+
+def _file_mtime(file_path):
+    """获取文件修改时间，作为缓存键的一部分，文件不存在时返回None"""
+    try:
+        return os.path.getmtime(file_path)
+    except OSError:
+        return None
+
+def _nan_to_none(values):
+    """将数组转为object数组并以None表示NaN，写入Excel时为空单元格"""
+    values = np.asarray(values, dtype=np.float64)
+    result = values.astype(object)
+    result[np.isnan(values)] = None
+    return result
+
+def read_file_worker(file_path, skiprows=0, engine=None, fast_mode=True):
+    """在子进程中读取单个Excel文件
+    
+    参数:
+        file_path: 文件路径
+        skiprows: 跳过数据前几行
+        engine: pandas读取引擎
+        fast_mode: 是否使用openpyxl只读模式读取
+        
+    返回:
+        tuple: (file_path, data, error)
+    """
+    data, error = ud.read_excel_data(file_path, skiprows, engine=engine, fast_mode=fast_mode)
+    return file_path, data, error
+
+def get_load_workers():
+    """获取并行读取文件的进程数
+    
+    可通过环境变量 LOAD_FILES_NUM_THREADS 设置，默认为CPU核数减1
+    
+    返回:
+        int: 进程数
+    """
+    try:
+        workers = int(os.environ.get("LOAD_FILES_NUM_THREADS", 0))
+    except ValueError:
+        workers = 0
+    return workers if workers > 0 else max(1, (os.cpu_count() or 2) - 1)
+
+def process_cycles(raw_displacement, raw_force, cycle_count=3, peak_prominence=0.1, precision="float32"):
+    """预处理数据并识别循环
+    
+    只包含数值计算，不依赖HysteresisData实例，可在子进程中执行
+    
+    参数:
+        raw_displacement: 原始位移数据
+        raw_force: 原始力数据
+        cycle_count: 循环次数
+        peak_prominence: 峰值识别阈值
+        precision: 预处理精度，"float32"或"float64"
+        
+    返回:
+        tuple: (disp_processed, force_processed, cycles, cycle_table, error)
+    """
+    dtype = np.float64 if precision == "float64" else np.float32
+    disp_processed, force_processed, _ = ud.preprocess_data(raw_displacement, raw_force, dtype=dtype)
+    
+    cycles, cycle_table, error = ud.identify_cycles_by_direction(
+        disp_processed, 
+        force_processed, 
+        cycle_count=cycle_count,
+        min_prominence=peak_prominence,
+        start_threshold=0.05
+    )
+    
+    return disp_processed, force_processed, cycles, cycle_table, error
+
+def batch_process_worker(file_path, skiprows, engine, fast_mode, disp_channel, force1_channel,
+                         force2_channel=None, cycle_count=3, peak_prominence=0.1, precision="float32"):
+    """在子进程中读取单个文件并识别循环，供批量处理使用
+    
+    只读取所需通道，读取失败时回退到读取全部列
+    
+    参数:
+        file_path: 文件路径
+        skiprows: 跳过数据前几行
+        engine: pandas读取引擎
+        fast_mode: 是否使用openpyxl只读模式读取
+        disp_channel: 位移通道名称
+        force1_channel: 力通道1名称
+        force2_channel: 力通道2名称(可选)
+        cycle_count: 循环次数
+        peak_prominence: 峰值识别阈值
+        precision: 预处理精度，"float32"或"float64"
+        
+    返回:
+        tuple: (disp_processed, force_processed, cycles, cycle_table, error)
+    """
+    channels = [c for c in (disp_channel, force1_channel, force2_channel) if c]
+    data, _, error = ud.read_excel_columns(file_path, channels, skiprows, engine=engine)
+    if error:
+        data, error = ud.read_excel_data(file_path, skiprows, engine=engine, fast_mode=fast_mode)
+    if error or data is None or data.empty:
+        return None, None, None, None, f"读取文件失败: {error or '文件为空'}"
+    
+    disp, force, error = ud.extract_channel_data(data, disp_channel, force1_channel, force2_channel)
+    if error:
+        return None, None, None, None, f"提取通道数据失败: {error}"
+    
+    return process_cycles(disp, force, cycle_count, peak_prominence, precision)
+
 class HysteresisData:
     """滞回曲线数据处理类"""
     
@@ -22,25 +197,66 @@ class HysteresisData:
         # 文件相关变量
         self.file_path = None
         self.file_paths = []
+        self.file_names = []  # 与file_paths对应的文件名，用于界面显示
         self.current_file_index = 0
         
         # 数据变量
         self.data = None
+        self.columns = []  # 当前文件的全部列名
+        self._col_set = frozenset()  # 当前数据的列名集合，用于快速检查通道
+        self.selected_channels = None  # 已选择的通道，设置后加载文件只读取这些列
         self.raw_displacement = None
         self.raw_force = None
         self.processed_displacement = None
         self.processed_force = None
-        self.processed_data = None
         self.cycles = None
         self.cycle_features = None
         self.skeleton_data = None
         self.backbone_curve = None
         
+        # 各循环特征点的结构化数组(ud.CYCLE_TABLE_DTYPE)，按循环编号排序，用于向量化计算
+        self.cycle_table = None
+        
         # 工况数据
         self.workcase_data = []
         
+        # 所有工况的峰值点，按列分别存储，按需倍增容量
+        self._peak_disp = np.empty(64, dtype=np.float64)
+        self._peak_force = np.empty(64, dtype=np.float64)
+        self._peak_anomaly = np.empty(64, dtype=np.bool_)
+        self._peak_count = 0
+        self.keep_workcase_arrays = True  # 为False时工况只保留特征点，不保存处理后数据和循环数组
+        self._clean_peaks = None  # 去除异常点后的 (位移数组, 力数组)，工况变化时重新生成
+        self._workcase_version = 0  # 工况列表每次变化时递增
+        self._skeleton_cache = OrderedDict()  # (工况版本, 位移阈值) -> skeleton_data
+        self.skeleton_cache_size = 8
+        
         # 设置
         self.skiprows = 0
+        self.use_parquet_cache = True
+        self.use_calamine = True  # 使用python-calamine引擎读取Excel
+        self.calamine_threads = True  # 使用calamine时多文件预读取改用线程池，避免创建进程的开销
+        self.fast_excel = True  # 未使用calamine时以openpyxl只读模式读取xlsx，不读取公式和样式
+        self.precision = "float32"  # 预处理精度，需要更高精度时设为"float64"
+        self.raw_precision = "float64"  # 原始通道数据精度，设为"float32"可使内存占用减半
+        
+        # 处理后数据点数超过该值时写入临时文件并以只读内存映射共享给各工况
+        self.memmap_threshold = 1_000_000
+        self._storage_dir = None
+        self._storage_finalizer = None
+        self._memmap_files = set()  # 已创建且尚未删除的内存映射文件
+        
+        # 预读取的数据缓存 {(文件路径, skiprows, 修改时间): DataFrame}
+        self._data_cache = {}
+        
+        # 相邻文件预取缓存，后台线程写入，最多保留3个，键同预读取缓存
+        self._prefetch_cache = OrderedDict()
+        self._prefetch_lock = threading.Lock()
+        self.prefetch_size = 3
+        
+        # 已加载文件的LRU缓存 {(文件路径, skiprows, 修改时间): (DataFrame, 列名)}
+        self._file_cache = OrderedDict()
+        self.file_cache_size = 16
         
         # 多工况相关
         self.workcases = []
@@ -54,6 +270,28 @@ class HysteresisData:
         self.params = {}
         logger.info("数据处理器初始化完成")
     
+    @property
+    def file_path(self):
+        """当前文件路径"""
+        return self._file_path
+    
+    @file_path.setter
+    def file_path(self, value):
+        # 文件名和不含扩展名的文件名随路径一起更新，日志和工况名直接使用
+        self._file_path = value
+        self.file_name = os.path.basename(value) if value else None
+        self.file_stem = os.path.splitext(self.file_name)[0] if value else None
+    
+    @property
+    def processed_data(self):
+        """处理后的数据 (位移数组, 力数组)，未处理时为None
+        
+        位移和力分别保存，这里只按需组合，不另外存储
+        """
+        if self.processed_displacement is None or self.processed_force is None:
+            return None
+        return self.processed_displacement, self.processed_force
+    
     def reset_processed_data(self):
         """重置处理后的数据"""
         logger.debug("重置处理后的数据")
@@ -61,34 +299,255 @@ class HysteresisData:
         self.raw_force = None
         self.processed_displacement = None
         self.processed_force = None
-        self.processed_data = None
         self.cycles = None
         self.cycle_features = None
         self.skeleton_data = None
         self.backbone_curve = None
+        self.cycle_table = None
         self.params = {}
+        self._release_storage()
+    
+    def _excel_engine(self):
+        """获取读取Excel使用的引擎，python-calamine未安装时关闭calamine
+        
+        返回:
+            str: "calamine"，或None表示使用pandas默认引擎
+        """
+        if self.use_calamine:
+            try:
+                import python_calamine  # noqa: F401
+            except ImportError:
+                logger.warning("未安装python-calamine模块，使用默认引擎读取Excel")
+                self.use_calamine = False
+        return "calamine" if self.use_calamine else None
+    
+    def _read_file(self, file_path, skiprows=0):
+        """读取数据文件，优先使用同目录下的Parquet缓存
+        
+        缓存文件名为 <文件路径>.<skiprows>.parquet，仅当其修改时间不早于
+        源文件时才会被使用；否则解析Excel并重新写入缓存
+        
+        参数:
+            file_path: 文件路径
+            skiprows: 跳过数据前几行
+            
+        返回:
+            tuple: (data, error)
+        """
+        cache_path = f"{file_path}.{skiprows}.parquet"
+        
+        if self.use_parquet_cache:
+            try:
+                if (os.path.exists(cache_path) and
+                        os.path.getmtime(cache_path) >= os.path.getmtime(file_path)):
+                    data = pd.read_parquet(cache_path, engine="pyarrow")
+                    logger.debug("从Parquet缓存读取: %s", cache_path)
+                    return data, None
+            except ImportError:
+                logger.warning("未安装pyarrow模块，已禁用Parquet缓存")
+                self.use_parquet_cache = False
+            except Exception as e:
+                logger.warning(f"读取Parquet缓存失败: {str(e)}")
+        
+        data, error = ud.read_excel_data(file_path, skiprows, engine=self._excel_engine(),
+                                         fast_mode=self.fast_excel)
+        
+        if self.use_parquet_cache and not error and data is not None:
+            try:
+                # 先写入同目录下的临时文件再替换，其他线程不会读到写了一半的缓存
+                fd, tmp_path = tempfile.mkstemp(suffix=".parquet.tmp",
+                                                dir=os.path.dirname(os.path.abspath(cache_path)))
+                os.close(fd)
+                try:
+                    data.to_parquet(tmp_path, engine="pyarrow", compression="zstd")
+                    os.replace(tmp_path, cache_path)
+                except BaseException:
+                    os.remove(tmp_path)
+                    raise
+                logger.debug("已写入Parquet缓存: %s", cache_path)
+            except ImportError:
+                logger.warning("未安装pyarrow模块，已禁用Parquet缓存")
+                self.use_parquet_cache = False
+            except Exception as e:
+                logger.warning(f"写入Parquet缓存失败: {str(e)}")
+        
+        return data, error
+    
+    def _load_data(self, file_path):
+        """读取文件数据并更新列名
+        
+        依次尝试已加载文件缓存、预读取缓存、预取缓存；已选择通道时只读取所选列，
+        否则读取全部列。各缓存均以文件修改时间为键，文件被修改后自动失效
+        
+        参数:
+            file_path: 文件路径
+            
+        返回:
+            tuple: (data, error)
+        """
+        cache_key = (file_path, self.skiprows, _file_mtime(file_path))
+        
+        cached = self._file_cache.get(cache_key)
+        if cached is not None and self._covers_selection(*cached):
+            self._file_cache.move_to_end(cache_key)
+            data, self.columns = cached
+            return data, None
+        
+        data, error = self._load_data_uncached(file_path, cache_key)
+        if not error and data is not None:
+            self._file_cache[cache_key] = (data, self.columns)
+            while len(self._file_cache) > self.file_cache_size:
+                self._file_cache.popitem(last=False)
+        return data, error
     
-    def load_file(self, file_path, skiprows=0):
+    def _load_data_uncached(self, file_path, key):
+        """从预读取缓存、预取缓存或文件读取数据并更新列名
+        
+        参数:
+            file_path: 文件路径
+            key: 缓存键 (文件路径, skiprows, 修改时间)
+            
+        返回:
+            tuple: (data, error)
+        """
+        data = self._data_cache.get(key)
+        if data is None:
+            with self._prefetch_lock:
+                data = self._prefetch_cache.pop(key, None)
+        if data is None:
+            data = self._slice_cached(key)
+        if data is not None and self._covers_selection(data, data.columns):
+            self.columns = list(data.columns)
+            return data, None
+        
+        if self.selected_channels:
+            data, header, error = ud.read_excel_columns(
+                file_path, self.selected_channels, self.skiprows, engine=self._excel_engine()
+            )
+            if not error:
+                self.columns = header
+                return data, None
+            logger.warning(f"按所选通道读取失败，改为读取全部列: {error}")
+        
+        data, error = self._read_file(file_path, self.skiprows)
+        if not error and data is not None:
+            self.columns = list(data.columns)
+        return data, error
+    
+    def _covers_selection(self, data, columns):
+        """检查缓存的数据能否用于当前选择的通道
+        
+        读取了全部列的数据总是可用（所选通道不在文件中时重新读取也无法得到）；
+        只读取了部分通道的数据必须包含当前所选的全部通道
+        
+        参数:
+            data: 缓存的DataFrame
+            columns: 读取该数据时文件的全部列名
+            
+        返回:
+            bool: 是否可用
+        """
+        if not self.selected_channels or len(data.columns) == len(columns):
+            return True
+        return all(c in data.columns for c in self.selected_channels)
+    
+    def _slice_cached(self, key):
+        """由同一文件跳过行数较少的已读取数据截取，修改跳过行数时无需重新解析文件
+        
+        参数:
+            key: 缓存键 (文件路径, skiprows, 修改时间)
+            
+        返回:
+            DataFrame: 截取后的数据，没有可用的缓存时返回None
+        """
+        file_path, skiprows, mtime = key
+        for (path, cached_skip, cached_mtime), (data, columns) in self._file_cache.items():
+            if path != file_path or cached_mtime != mtime or cached_skip > skiprows:
+                continue
+            # 只读取了所选通道的数据已去掉空行，行号不再对应
+            if len(data.columns) != len(columns):
+                continue
+            logger.debug("由已读取数据截取: %s, skiprows=%s", os.path.basename(file_path), skiprows)
+            # 被跳过的行可能是单位等文本，截取后重新推断列类型
+            return data.iloc[skiprows - cached_skip:].reset_index(drop=True).infer_objects()
+        return None
+    
+    def _prune_data_cache(self, file_paths):
+        """删除预读取缓存中不属于给定文件列表的数据
+        
+        参数:
+            file_paths: 需要保留的文件路径列表
+        """
+        keep = set(file_paths)
+        for key in [key for key in self._data_cache if key[0] not in keep]:
+            del self._data_cache[key]
+    
+    def clear_cache(self):
+        """清空所有已读取数据的缓存"""
+        self._file_cache.clear()
+        self._data_cache.clear()
+        with self._prefetch_lock:
+            self._prefetch_cache.clear()
+    
+    def set_selected_channels(self, channels):
+        """设置需要读取的通道，之后加载文件时只读取这些列
+        
+        当前数据中缺少所选通道时，按所选通道重新读取当前文件
+        
+        参数:
+            channels: 通道名称列表
+            
+        返回:
+            tuple: (success, message)
+        """
+        self.selected_channels = list(dict.fromkeys(c for c in channels if c)) or None
+        
+        if self.data is None or not self.file_path or not self.selected_channels:
+            return True, ""
+        
+        if all(c in self.data.columns for c in self.selected_channels):
+            return True, ""
+        
+        data, header, error = ud.read_excel_columns(
+            self.file_path, self.selected_channels, self.skiprows, engine=self._excel_engine()
+        )
+        if error:
+            return False, f"读取所选通道出错: {error}"
+        
+        self.data = data
+        self._col_set = frozenset(data.columns)
+        self.columns = header
+        return True, "已按所选通道重新读取数据"
+    
+    def load_file(self, file_path, skiprows=0, channels=None):
         """加载单个文件
         
+        fast_excel为True时xlsx文件以openpyxl只读模式读取：单元格公式只取其缓存的
+        计算结果，样式不会被读取，但打开大文件时快得多
+        
         参数:
             file_path: 文件路径
             skiprows: 跳过数据前几行
+            channels: 只读取的通道名称列表，为None时沿用已选择的通道
             
         返回:
             tuple: (success, message)
         """
         try:
-            logger.info(f"加载文件: {file_path}, skiprows={skiprows}")
+            logger.info("加载文件: %s, skiprows=%s", file_path, skiprows)
+            
+            if channels is not None:
+                self.selected_channels = list(dict.fromkeys(c for c in channels if c)) or None
             
             # 设置路径和跳过行数
             self.file_path = file_path
             self.file_paths = [file_path]
+            self.file_names = [os.path.basename(file_path)]
             self.current_file_index = 0
             self.skiprows = skiprows
             
             # 读取数据
-            data, error = ud.read_excel_data(file_path, skiprows)
+            data, error = self._load_data(file_path)
             
             if error:
                 logger.error(f"读取文件出错: {error}")
@@ -100,23 +559,56 @@ class HysteresisData:
             
             # 保存数据
             self.data = data
+            self._col_set = frozenset(data.columns)
             
             # 重置处理后的数据
             self.reset_processed_data()
             
-            logger.info(f"成功加载文件: {os.path.basename(file_path)}")
-            return True, f"成功加载文件: {os.path.basename(file_path)}"
+            logger.info("成功加载文件: %s", self.file_name)
+            return True, f"成功加载文件: {self.file_name}"
             
         except Exception as e:
             logger.error(f"加载文件出错: {str(e)}", exc_info=True)
             return False, f"加载文件出错: {str(e)}"
     
-    def load_multiple_files(self, file_paths, skiprows=0):
+    def peek_channels(self, file_path):
+        """只读取文件的标题行，获取可选的通道名称
+        
+        界面可先调用此方法让用户选择通道，再用load_with_channels只读取所选列
+        
+        参数:
+            file_path: 文件路径
+            
+        返回:
+            tuple: (success, 通道名称列表或错误信息)
+        """
+        header, error = ud.read_excel_header(file_path, engine=self._excel_engine())
+        if error:
+            logger.error(f"读取通道名称出错: {error}")
+            return False, f"读取通道名称出错: {error}"
+        return True, header
+    
+    def load_with_channels(self, file_path, channels, skiprows=0):
+        """只读取指定通道加载单个文件
+        
+        参数:
+            file_path: 文件路径
+            channels: 需要读取的通道名称列表
+            skiprows: 跳过数据前几行
+            
+        返回:
+            tuple: (success, message)
+        """
+        return self.load_file(file_path, skiprows, channels=channels)
+    
+    def load_multiple_files(self, file_paths, skiprows=0, preload_all=False, channels=None):
         """加载多个数据文件
         
         参数:
             file_paths: 文件路径列表
             skiprows: 跳过数据前几行
+            preload_all: 是否先用进程池并行读取所有文件
+            channels: 只读取的通道名称列表，为None时沿用已选择的通道
             
         返回:
             tuple: (success, message)
@@ -125,26 +617,33 @@ class HysteresisData:
             if not file_paths:
                 return False, "未选择文件"
             
-            # 确保file_paths是列表
-            file_paths_list = list(file_paths)
-            logger.info(f"加载多个文件: {len(file_paths_list)} 个文件")
+            if channels is not None:
+                self.selected_channels = list(dict.fromkeys(c for c in channels if c)) or None
+            
+            # 保存文件路径列表和跳过行数，list()已创建新的列表，不与调用方共享
+            self.file_paths = list(file_paths)
+            self._prune_data_cache(self.file_paths)
+            logger.info("加载多个文件: %s 个文件", len(self.file_paths))
             
-            # 保存文件路径列表和跳过行数
-            self.file_paths = file_paths_list.copy()  # 使用.copy()创建一个新的列表副本
+            self.file_names = [os.path.basename(p) for p in self.file_paths]
             self.current_file_index = 0
             self.skiprows = skiprows  # 设置skiprows实例变量
             
-            logger.debug(f"设置skiprows = {skiprows}")
+            logger.debug("设置skiprows = %s", skiprows)
+            
+            # 并行读取所有文件，后续切换文件时直接使用缓存；只读取所选通道时逐个按列读取
+            if preload_all and len(self.file_paths) > 1 and not self.selected_channels:
+                self.preload_files(self.file_paths, use_processes=True)
             
             # 加载第一个文件
             success, message = self.load_current_file()
             
             if success:
-                logger.info(f"成功加载第一个文件，总共 {len(self.file_paths)} 个文件")
+                logger.info("成功加载第一个文件，总共 %s 个文件", len(self.file_paths))
                 if len(self.file_paths) > 1:
-                    return True, f"已加载 {len(self.file_paths)} 个文件中的第 1 个: {os.path.basename(self.file_path)}"
+                    return True, f"已加载 {len(self.file_paths)} 个文件中的第 1 个: {self.file_name}"
                 else:
-                    return True, f"成功加载文件: {os.path.basename(self.file_path)}"
+                    return True, f"成功加载文件: {self.file_name}"
             else:
                 logger.error(f"加载第一个文件失败: {message}")
                 return False, message
@@ -153,26 +652,125 @@ class HysteresisData:
             logger.error(f"加载多个文件过程中发生错误: {str(e)}", exc_info=True)
             return False, f"加载多个文件过程中发生错误: {str(e)}"
     
-    def load_folder(self, folder_path, file_pattern="*.xlsx"):
+    def _read_one(self, file_path, skiprows):
+        """读取单个文件，供线程池调用
+        
+        返回:
+            tuple: (file_path, data, error)
+        """
+        data, error = self._read_file(file_path, skiprows)
+        return file_path, data, error
+    
+    def preload_files(self, file_paths, max_workers=None, use_processes=False):
+        """并行读取多个文件并放入缓存
+        
+        参数:
+            file_paths: 文件路径列表
+            max_workers: 最大线程数，默认为 min(8, CPU核数)；使用进程池时默认为 get_load_workers()
+            use_processes: 是否使用进程池解析Excel，进程池不可用时回退到线程池
+            
+        返回:
+            int: 成功读取的文件数
+        """
+        skiprows = self.skiprows
+        results = None
+        
+        # calamine在Rust中解析文件，线程池即可并行，且无需启动子进程和重新导入模块
+        if use_processes and self.calamine_threads and self._excel_engine() == "calamine":
+            use_processes = False
+            max_workers = max_workers or os.cpu_count() or 1
+        
+        # 读取前记录修改时间，已在缓存中且未被修改的文件无需重复读取
+        keys = {p: (p, skiprows, _file_mtime(p)) for p in file_paths}
+        file_paths = [p for p in file_paths if keys[p] not in self._data_cache]
+        if not file_paths:
+            return 0
+        
+        if use_processes:
+            workers = max_workers or get_load_workers()
+            engine = self._excel_engine()
+            logger.info("多进程预读取 %s 个文件, 进程数: %s", len(file_paths), workers)
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    results = list(pool.map(read_file_worker, file_paths,
+                                            [skiprows] * len(file_paths),
+                                            [engine] * len(file_paths),
+                                            [self.fast_excel] * len(file_paths)))
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(f"进程池不可用，改用线程池读取: {str(e)}")
+                results = None
+        
+        if results is None:
+            if max_workers is None:
+                max_workers = min(8, os.cpu_count() or 1)
+            logger.info("并行预读取 %s 个文件, 线程数: %s", len(file_paths), max_workers)
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                # map按输入顺序返回结果，保证顺序确定
+                results = list(pool.map(lambda p: self._read_one(p, skiprows), file_paths))
+        
+        loaded = 0
+        for path, data, error in results:
+            if error or data is None or data.empty:
+                logger.warning(f"预读取文件失败: {os.path.basename(path)}, {error}")
+                continue
+            self._data_cache[keys[path]] = data
+            loaded += 1
+        
+        logger.info("预读取完成: %s/%s", loaded, len(file_paths))
+        return loaded
+    
+    def prefetch_file(self, file_path):
+        """在后台预先读取文件，供切换文件时直接使用
+        
+        参数:
+            file_path: 文件路径
+        """
+        key = (file_path, self.skiprows, _file_mtime(file_path))
+        with self._prefetch_lock:
+            if key in self._data_cache or key in self._prefetch_cache:
+                return
+        
+        data, error = self._read_file(file_path, key[1])
+        if error or data is None or data.empty:
+            logger.debug("预取文件失败: %s, %s", os.path.basename(file_path), error)
+            return
+        
+        with self._prefetch_lock:
+            self._prefetch_cache[key] = data
+            while len(self._prefetch_cache) > self.prefetch_size:
+                self._prefetch_cache.popitem(last=False)
+        logger.debug("已预取文件: %s", os.path.basename(file_path))
+    
+    def load_folder(self, folder_path, file_pattern="*.xlsx", max_workers=None):
         """加载文件夹中的所有数据文件
         
         参数:
             folder_path: 文件夹路径
             file_pattern: 文件匹配模式
+            max_workers: 并行读取的最大进程数（只读取所选通道时不预读取）
             
         返回:
             tuple: (success, message)
         """
         try:
-            # 查找匹配的文件
-            pattern = os.path.join(folder_path, file_pattern)
-            file_paths = glob.glob(pattern)
+            # 查找匹配的文件，scandir一次遍历目录即可得到文件类型，无需逐个stat
+            with os.scandir(folder_path) as entries:
+                names = [entry.name for entry in entries if entry.is_file()]
+            file_paths = [os.path.join(folder_path, name) for name in fnmatch.filter(names, file_pattern)]
             
             if not file_paths:
                 return False, f"在 {folder_path} 中没有找到 {file_pattern} 文件"
             
-            # 按名称排序
-            file_paths.sort()
+            # 按名称排序，不区分大小写，与不区分大小写的文件系统上的显示顺序一致
+            file_paths.sort(key=str.lower)
+            
+            # 只保留本次文件的预读取数据，之前打开的文件夹的数据不再占用内存
+            self._prune_data_cache(file_paths)
+            
+            # 并行读取所有文件，后续切换文件时直接使用缓存；Excel解析受GIL限制，使用进程池。
+            # 只读取所选通道时与load_multiple_files一致，不预读取全部列，切换文件时逐个按列读取
+            if not self.selected_channels:
+                self.preload_files(file_paths, max_workers, use_processes=True)
             
             # 设置文件路径列表
             return self.load_multiple_files(file_paths, self.skiprows)
@@ -181,34 +779,31 @@ class HysteresisData:
             logger.error(f"加载文件夹出错: {str(e)}")
             return False, f"加载文件夹过程中发生错误: {str(e)}"
     
-    def load_current_file(self):
+    def load_current_file(self, channels=None):
         """加载当前索引的文件
         
+        参数:
+            channels: 只读取的通道名称列表，为None时沿用已选择的通道
+            
         返回:
             tuple: (success, message)
         """
+        if channels is not None:
+            self.selected_channels = list(dict.fromkeys(c for c in channels if c)) or None
+        
         if not self.file_paths or self.current_file_index >= len(self.file_paths):
             logger.error("无效的文件索引")
             return False, "无效的文件索引"
         
         # 获取当前文件路径
         current_path = self.file_paths[self.current_file_index]
-        logger.info(f"加载当前文件: {os.path.basename(current_path)}, 索引: {self.current_file_index + 1}/{len(self.file_paths)}")
+        self.file_path = current_path
+        logger.info("加载当前文件: %s, 索引: %s/%s", self.file_name, self.current_file_index + 1, len(self.file_paths))
         
         try:
-            # 保存原有的file_paths
-            saved_file_paths = self.file_paths.copy()
-            saved_current_index = self.current_file_index
-            
-            # 设置当前文件路径
-            self.file_path = current_path
-            
-            # 读取数据
-            data, error = ud.read_excel_data(current_path, self.skiprows)
             
-            # 恢复file_paths
-            self.file_paths = saved_file_paths
-            self.current_file_index = saved_current_index
+            # 读取数据（读取过程不修改file_paths和current_file_index）
+            data, error = self._load_data(current_path)
             
             if error:
                 logger.error(f"读取文件出错: {error}")
@@ -220,12 +815,13 @@ class HysteresisData:
             
             # 保存数据
             self.data = data
+            self._col_set = frozenset(data.columns)
             
             # 重置处理后的数据
             self.reset_processed_data()
             
-            logger.info(f"成功加载文件: {os.path.basename(current_path)}, file_paths长度: {len(self.file_paths)}")
-            return True, f"成功加载文件: {os.path.basename(current_path)}"
+            logger.info("成功加载文件: %s, file_paths长度: %s", self.file_name, len(self.file_paths))
+            return True, f"成功加载文件: {self.file_name}"
             
         except Exception as e:
             logger.error(f"加载文件出错: {str(e)}", exc_info=True)
@@ -261,6 +857,27 @@ class HysteresisData:
         else:
             return False, "已经是第一个文件"
     
+    def set_channels(self, disp_channel, force1_channel, force2_channel=None):
+        """检查通道是否存在并提取通道数据
+        
+        参数:
+            disp_channel: 位移通道名称
+            force1_channel: 力通道1名称
+            force2_channel: 力通道2名称(可选)
+            
+        返回:
+            tuple: (success, message)
+        """
+        if self.data is None:
+            return False, "没有加载数据"
+        
+        missing = [c for c in (disp_channel, force1_channel, force2_channel)
+                   if c and c not in self._col_set]
+        if missing:
+            return False, f"数据中不存在通道: {', '.join(map(str, missing))}"
+        
+        return self.extract_channel_data(disp_channel, force1_channel, force2_channel or None)
+    
     def extract_channel_data(self, disp_channel, force1_channel, force2_channel=None):
         """提取通道数据
         
@@ -277,7 +894,8 @@ class HysteresisData:
         
         # 提取通道数据
         disp, force, error = ud.extract_channel_data(
-            self.data, disp_channel, force1_channel, force2_channel
+            self.data, disp_channel, force1_channel, force2_channel,
+            dtype=np.dtype(self.raw_precision)
         )
         
         if error:
@@ -312,29 +930,31 @@ class HysteresisData:
             if self.raw_displacement is None or self.raw_force is None:
                 return False, "请先提取通道数据（使用extract_channel_data）"
             
-            # 预处理数据
-            disp_processed, force_processed, _ = ud.preprocess_data(self.raw_displacement, self.raw_force)
+            # 预处理数据并识别循环
+            disp_processed, force_processed, cycles, cycle_table, error = process_cycles(
+                self.raw_displacement, self.raw_force, cycle_count, peak_prominence, self.precision
+            )
+            
+            # 处理后的数组不再修改，设为只读以便添加工况时直接共享
+            disp_processed = self._share_array(disp_processed)
+            force_processed = self._share_array(force_processed)
             
-            # 保存预处理后的数据
+            # 保存预处理后的数据，替换下来的数组不再被引用时删除其映射文件
             self.processed_displacement = disp_processed
             self.processed_force = force_processed
-            self.processed_data = (disp_processed, force_processed)
-            
-            # 识别循环
-            cycles, cycle_features, error = ud.identify_cycles_by_direction(
-                disp_processed, 
-                force_processed, 
-                cycle_count=cycle_count,
-                min_prominence=peak_prominence,
-                start_threshold=0.05
-            )
+            self.cycles = None
+            self.cycle_table = None
+            self._release_storage()
             
             if error:
                 return False, f"循环识别失败: {error}"
             
-            # 保存循环数据
-            self.cycles = cycles
-            self.cycle_features = cycle_features
+            # 保存循环数据，特征点字典由特征点表生成，各循环改为共享后数组的视图，不再引用原数组
+            self.cycle_table = cycle_table
+            self.cycle_features = ud.cycle_features_from_table(cycle_table)
+            self.cycles = {
+                cycle_num: self.get_cycle_data(cycle_num) for cycle_num in self.cycle_table['cycle'].tolist()
+            }
             
             # 保存处理参数
             self.params = {
@@ -342,7 +962,8 @@ class HysteresisData:
                 'force_channel': getattr(self, 'force_channel_name', None),
                 'force2_channel': getattr(self, 'force2_channel_name', None),
                 'cycle_count': cycle_count,
-                'peak_prominence': peak_prominence
+                'peak_prominence': peak_prominence,
+                'precision': self.precision
             }
             
             return True, f"成功识别 {len(cycles)} 个循环"
@@ -351,6 +972,192 @@ class HysteresisData:
             logger.error(f"处理数据出错: {str(e)}", exc_info=True)
             return False, f"处理数据出错: {str(e)}"
     
+    def start_batch(self, file_paths, disp_channel, force1_channel, force2_channel=None,
+                    cycle_count=3, peak_prominence=0.1, max_workers=None):
+        """将多个文件的批量处理任务提交到进程池，不等待其完成
+        
+        读取、通道提取、预处理和循环识别都在子进程中执行；调用方在任务完成后
+        按文件顺序调用add_batch_result添加工况
+        
+        参数:
+            file_paths: 文件路径列表
+            disp_channel: 位移通道名称
+            force1_channel: 力通道1名称
+            force2_channel: 力通道2名称(可选)
+            cycle_count: 循环次数
+            peak_prominence: 峰值识别阈值
+            max_workers: 最大进程数，默认为CPU核数减一
+            
+        返回:
+            tuple: (futures, parameters)，futures与file_paths一一对应
+        """
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 2) - 1)
+        max_workers = max(1, min(max_workers, len(file_paths)))
+        
+        logger.info("批量处理 %s 个文件, 进程数: %s", len(file_paths), max_workers)
+        engine = self._excel_engine()
+        pool = ProcessPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [
+                pool.submit(batch_process_worker, path, self.skiprows, engine, self.fast_excel,
+                            disp_channel, force1_channel, force2_channel,
+                            cycle_count, peak_prominence, self.precision)
+                for path in file_paths
+            ]
+        finally:
+            # 不等待任务完成，已提交的任务执行完毕后进程池自动退出
+            pool.shutdown(wait=False)
+        
+        parameters = {
+            'displacement_channel': disp_channel,
+            'force_channel': force1_channel,
+            'force2_channel': force2_channel,
+            'cycle_count': cycle_count,
+            'peak_prominence': peak_prominence,
+            'precision': self.precision
+        }
+        return futures, parameters
+    
+    def add_batch_result(self, file_path, future, parameters):
+        """将已完成的批量处理任务结果添加为工况
+        
+        参数:
+            file_path: 文件路径
+            future: start_batch返回的已完成任务
+            parameters: start_batch返回的处理参数
+            
+        返回:
+            tuple: (success, message)
+        """
+        file_name = os.path.basename(file_path)
+        try:
+            disp_processed, force_processed, cycles, cycle_table, error = future.result()
+        except Exception as e:
+            error = str(e)
+        if error:
+            logger.warning(f"批量处理失败: {file_name}, {error}")
+            return False, error
+        
+        self._append_workcase({
+            'name': f"工况 {len(self.workcase_data) + 1} ({file_name})",
+            'file_name': file_name,
+            'file_path': file_path,
+            'processed_data': (disp_processed, force_processed),
+            'cycles': cycles,
+            'cycle_table': cycle_table,
+            'cycle_features': ud.cycle_features_from_table(cycle_table),
+            'parameters': dict(parameters)
+        })
+        return True, f"已添加工况: {file_name}"
+    
+    def get_cycle_data(self, cycle_num):
+        """获取指定循环的位移和力数据
+        
+        返回的数组是处理后数组的只读视图，与其共享内存
+        
+        参数:
+            cycle_num: 循环编号
+            
+        返回:
+            tuple: (位移数组, 力数组)，循环不存在时返回 (None, None)
+        """
+        table = self.cycle_table
+        if table is None or self.processed_displacement is None:
+            return None, None
+        
+        index = int(np.searchsorted(table['cycle'], cycle_num))
+        if index >= len(table) or table['cycle'][index] != cycle_num:
+            return None, None
+        
+        start, end = int(table['start'][index]), int(table['end'][index])
+        return self.processed_displacement[start:end], self.processed_force[start:end]
+    
+    def _secant_stiffness(self):
+        """由特征点表计算各循环的等效刚度（正负峰值点连线的斜率）
+        
+        返回:
+            tuple: (stiffness, valid)，无法计算的循环刚度为NaN
+        """
+        table = self.cycle_table
+        delta_disp = table['pos_disp'] - table['neg_disp']
+        delta_force = table['pos_force'] - table['neg_force']
+        valid = np.abs(delta_disp) > 1e-10  # 避免除零错误，缺失峰值点的NaN也被排除
+        stiffness = np.divide(delta_force, delta_disp, out=np.full(len(table), np.nan), where=valid)
+        return stiffness, valid
+    
+    def _share_array(self, arr):
+        """将处理后的数组设为只读，数据量较大时写入临时文件并返回只读内存映射
+        
+        参数:
+            arr: 处理后的数组
+            
+        返回:
+            ndarray: 只读数组或只读内存映射
+        """
+        if not isinstance(arr, np.ndarray):
+            return arr
+        
+        if arr.size < self.memmap_threshold:
+            arr.setflags(write=False)
+            return arr
+        
+        try:
+            if self._storage_dir is None:
+                self._storage_dir = tempfile.mkdtemp(prefix="hysteresis_")
+                # 程序退出时删除临时目录；finalize不持有实例的引用
+                self._storage_finalizer = weakref.finalize(
+                    self, shutil.rmtree, self._storage_dir, ignore_errors=True
+                )
+            
+            fd, path = tempfile.mkstemp(suffix=".dat", dir=self._storage_dir)
+            os.close(fd)
+            self._memmap_files.add(path)
+            mm = np.memmap(path, dtype=arr.dtype, mode='w+', shape=arr.shape)
+            mm[:] = arr
+            mm.flush()
+            del mm
+            return np.memmap(path, dtype=arr.dtype, mode='r', shape=arr.shape)
+        except Exception as e:
+            logger.warning(f"写入内存映射文件失败，保留在内存中: {str(e)}")
+            arr.setflags(write=False)
+            return arr
+    
+    def _release_storage(self):
+        """删除当前数据和各工况都不再引用的内存映射文件
+        
+        文件仍被映射而无法删除时（Windows）保留记录，下次释放时重试
+        """
+        if not self._memmap_files:
+            return
+        
+        arrays = [self.processed_displacement, self.processed_force]
+        for workcase in self.workcase_data:
+            arrays.extend(workcase.get('processed_data') or ())
+        in_use = {getattr(arr, 'filename', None) for arr in arrays}
+        
+        for path in list(self._memmap_files):
+            # np.memmap的filename为绝对路径
+            if os.path.abspath(path) in in_use:
+                continue
+            try:
+                os.remove(path)
+                self._memmap_files.discard(path)
+            except FileNotFoundError:
+                self._memmap_files.discard(path)
+            except OSError as e:
+                logger.debug("暂时无法删除内存映射文件: %s, %s", path, e)
+    
+    def close_workcase_storage(self):
+        """清空工况和处理后的数据，释放内存映射并删除临时文件"""
+        self._reset_workcases()
+        self.reset_processed_data()
+        if self._storage_dir is not None:
+            self._storage_finalizer()
+            self._storage_dir = None
+            self._storage_finalizer = None
+            self._memmap_files.clear()
+    
     def calculate_stiffness(self):
         """计算等效刚度
         
@@ -361,41 +1168,32 @@ class HysteresisData:
             if self.cycles is None or not self.cycles:
                 return False, None, "没有循环数据可以计算刚度"
             
-            if self.cycle_features is None or not self.cycle_features:
+            if self.cycle_table is None or not len(self.cycle_table):
                 return False, None, "没有循环特征点数据可以计算刚度"
             
-            # 计算每个循环的等效刚度
-            cycle_stiffness = {}
-            all_stiffness = []
-            
-            for cycle_num, features in self.cycle_features.items():
-                pos_peak = features.get('positive_peak')
-                neg_peak = features.get('negative_peak')
-                
-                if pos_peak and neg_peak:
-                    pos_x, pos_y = pos_peak
-                    neg_x, neg_y = neg_peak
-                    
-                    # 计算等效刚度 (斜率)
-                    delta_x = pos_x - neg_x
-                    delta_y = pos_y - neg_y
-                    
-                    if abs(delta_x) > 1e-10:  # 避免除零错误
-                        stiffness = delta_y / delta_x
-                        
-                        # 保存到结果字典
-                        cycle_stiffness[cycle_num] = {
-                            'equivalent': stiffness,
-                            'max_disp': pos_x,
-                            'min_disp': neg_x,
-                            'max_disp_force': pos_y,
-                            'min_disp_force': neg_y
-                        }
-                        
-                        all_stiffness.append(stiffness)
+            # 一次性计算所有循环的等效刚度 (斜率)
+            stiffness, valid = self._secant_stiffness()
+            stiffness = stiffness[valid]
+            rows = self.cycle_table[valid]
+            
+            # 保存到结果字典
+            cycle_stiffness = {
+                cycle_num: {
+                    'equivalent': k,
+                    'max_disp': max_disp,
+                    'min_disp': min_disp,
+                    'max_disp_force': max_force,
+                    'min_disp_force': min_force
+                }
+                for cycle_num, k, max_disp, min_disp, max_force, min_force in zip(
+                    rows['cycle'].tolist(), stiffness.tolist(),
+                    rows['pos_disp'].tolist(), rows['neg_disp'].tolist(),
+                    rows['pos_force'].tolist(), rows['neg_force'].tolist()
+                )
+            }
             
             # 计算平均等效刚度
-            avg_stiffness = sum(all_stiffness) / len(all_stiffness) if all_stiffness else 0
+            avg_stiffness = float(stiffness.mean()) if stiffness.size else 0
             
             # 返回结果
             results = {
@@ -411,9 +1209,84 @@ class HysteresisData:
             logger.error(f"计算等效刚度出错: {str(e)}", exc_info=True)
             return False, None, f"计算等效刚度出错: {str(e)}"
     
-    def generate_skeleton_curve(self):
+    def get_equivalent_stiffness(self):
+        """获取等效刚度结果，供控制器调用
+        
+        返回:
+            tuple: (success, results或错误信息)
+        """
+        success, results, message = self.calculate_stiffness()
+        return (True, results) if success else (False, message)
+    
+    def export_results(self, file_path):
+        """导出分析结果到Excel文件
+        
+        各循环的特征点、等效刚度和耗能按列一次计算后写入"循环结果"工作表，
+        骨架曲线和处理参数分别写入单独的工作表。使用openpyxl只写模式逐行写入
+        
+        参数:
+            file_path: 导出文件路径
+            
+        返回:
+            tuple: (success, message)
+        """
+        if self.cycles is None or not self.cycles:
+            return False, "没有循环数据可以导出，请先处理数据"
+        
+        try:
+            table = self.cycle_table
+            cycle_nums = table['cycle']
+            
+            # 特征点，缺失的峰值点为NaN
+            peaks = np.column_stack((table['pos_disp'], table['pos_force'],
+                                     table['neg_disp'], table['neg_force']))
+            anomaly = table['anomaly']
+            
+            # 等效刚度：正负峰值点连线的斜率
+            stiffness, _ = self._secant_stiffness()
+            
+            # 耗能：滞回环所围面积
+            energy = np.full(len(table), np.nan)
+            energy_nums, cycle_energy = ud.calculate_cycle_energy_batch(self.cycles)
+            energy[np.searchsorted(cycle_nums, energy_nums)] = cycle_energy
+            
+            # 只写模式逐行写入，不创建中间DataFrame，也不保留单元格对象
+            import openpyxl
+            workbook = openpyxl.Workbook(write_only=True)
+            
+            sheet = workbook.create_sheet("循环结果")
+            sheet.append(('循环编号', '正峰值位移', '正峰值力', '负峰值位移', '负峰值力', '等效刚度', '耗能', '异常'))
+            values = np.column_stack((peaks, stiffness, energy))
+            for row in zip(cycle_nums.tolist(), _nan_to_none(values).tolist(), anomaly.tolist()):
+                sheet.append((row[0], *row[1], row[2]))
+            
+            if self.skeleton_data is not None:
+                sheet = workbook.create_sheet("骨架曲线")
+                sheet.append(('位移', '力'))
+                for row in _nan_to_none(np.column_stack(self.skeleton_data)).tolist():
+                    sheet.append(row)
+            
+            if self.params:
+                sheet = workbook.create_sheet("处理参数")
+                sheet.append(('参数', '值'))
+                for key, value in self.params.items():
+                    sheet.append((key, value))
+            
+            workbook.save(file_path)
+            
+            return True, f"成功导出结果: {os.path.basename(file_path)}"
+        
+        except Exception as e:
+            logger.error(f"导出结果出错: {str(e)}", exc_info=True)
+            return False, f"导出结果过程中发生错误: {str(e)}"
+    
+    def generate_skeleton_curve(self, fast=True, displacement_threshold=0.001):
         """生成骨架曲线
         
+        参数:
+            fast: 是否直接使用循环特征中的峰值点生成，为False时使用ud.generate_skeleton_curve_improved
+            displacement_threshold: 快速生成时的位移差值阈值，小于此值的点会被视为重复点
+            
         返回:
             tuple: (success, skeleton_data, message)
         """
@@ -421,10 +1294,21 @@ class HysteresisData:
             return False, None, "没有循环数据，请先处理数据"
         
         try:
-            # 生成骨架曲线
-            skeleton_disp, skeleton_force, error = ud.generate_skeleton_curve_improved(
-                self.cycles, self.cycle_features
-            )
+            if fast:
+                # 只取非异常循环的正负峰值点
+                table = self.cycle_table[~self.cycle_table['anomaly']]
+                disp = np.concatenate((table['pos_disp'], table['neg_disp']))
+                force = np.concatenate((table['pos_force'], table['neg_force']))
+                present = ~np.isnan(disp)
+                skeleton_disp, skeleton_force = _envelope_points(
+                    disp[present], force[present], displacement_threshold
+                )
+                error = None if len(skeleton_disp) >= 2 else "点数不足，无法生成有效的骨架曲线"
+            else:
+                # 生成骨架曲线
+                skeleton_disp, skeleton_force, error = ud.generate_skeleton_curve_improved(
+                    self.cycles, self.cycle_features
+                )
             
             if error:
                 return False, None, f"生成骨架曲线出错: {error}"
@@ -438,6 +1322,71 @@ class HysteresisData:
             logger.error(f"生成骨架曲线出错: {str(e)}")
             return False, None, f"生成骨架曲线过程中发生错误: {str(e)}"
     
+    def _append_workcase(self, workcase):
+        """添加工况，并将其峰值点追加到峰值点数组
+        
+        keep_workcase_arrays为False时，提取峰值点后丢弃工况的处理后数据和循环数组，
+        工况占用的内存只与循环数有关，与数据点数无关
+        
+        参数:
+            workcase: 工况数据字典
+        """
+        self.workcase_data.append(workcase)
+        
+        # 按列取出各循环的正负峰值点，交替排列并去除缺失的峰值点
+        table = workcase.get('cycle_table')
+        if table is None:
+            table = np.empty(0, dtype=ud.CYCLE_TABLE_DTYPE)
+        disp = np.column_stack((table['pos_disp'], table['neg_disp'])).ravel()
+        force = np.column_stack((table['pos_force'], table['neg_force'])).ravel()
+        anomaly = np.repeat(table['anomaly'], 2)
+        present = ~np.isnan(disp)
+        disp, force, anomaly = disp[present], force[present], anomaly[present]
+        
+        if not self.keep_workcase_arrays:
+            workcase['processed_data'] = None
+            workcase['cycles'] = None
+        
+        if len(disp):
+            count = self._peak_count
+            needed = count + len(disp)
+            if needed > len(self._peak_disp):
+                capacity = len(self._peak_disp)
+                while capacity < needed:
+                    capacity *= 2
+                self._peak_disp = np.resize(self._peak_disp, capacity)
+                self._peak_force = np.resize(self._peak_force, capacity)
+                self._peak_anomaly = np.resize(self._peak_anomaly, capacity)
+            self._peak_disp[count:needed] = disp
+            self._peak_force[count:needed] = force
+            self._peak_anomaly[count:needed] = anomaly
+            self._peak_count = needed
+        
+        self._clean_peaks = None
+        self._workcase_version += 1
+        self._skeleton_cache.clear()
+    
+    def _reset_workcases(self):
+        """清空工况列表和峰值点数组"""
+        self.workcase_data = []
+        self._peak_count = 0
+        self._clean_peaks = None
+        self._workcase_version += 1
+        self._skeleton_cache.clear()
+        self._release_storage()
+    
+    def _get_clean_peaks(self):
+        """获取所有工况的非异常峰值点，结果保留至工况变化
+        
+        返回:
+            tuple: (位移数组, 力数组)
+        """
+        if self._clean_peaks is None:
+            count = self._peak_count
+            mask = ~self._peak_anomaly[:count]
+            self._clean_peaks = (self._peak_disp[:count][mask], self._peak_force[:count][mask])
+        return self._clean_peaks
+    
     def add_workcase(self, name=None):
         """添加当前工况到工况列表
         
@@ -453,7 +1402,7 @@ class HysteresisData:
         try:
             # 如果没有指定名称，使用文件名
             if name is None and self.file_path:
-                name = os.path.basename(self.file_path)
+                name = self.file_name
             elif name is None:
                 name = f"工况 {len(self.workcase_data) + 1}"
             
@@ -463,12 +1412,13 @@ class HysteresisData:
                 'file_path': self.file_path,
                 'processed_data': self.processed_data,
                 'cycles': self.cycles,
+                'cycle_table': self.cycle_table,
                 'cycle_features': self.cycle_features,
                 'skeleton_data': self.skeleton_data
             }
             
             # 添加到工况列表
-            self.workcase_data.append(workcase)
+            self._append_workcase(workcase)
             
             return True, f"成功添加工况: {name}"
         
@@ -482,7 +1432,7 @@ class HysteresisData:
         返回:
             tuple: (success, message)
         """
-        self.workcase_data = []
+        self._reset_workcases()
         return True, "已清空工况数据"
     
     def generate_multi_workcase_skeleton_curve(self, displacement_threshold=0.001):
@@ -499,75 +1449,35 @@ class HysteresisData:
             if len(self.workcase_data) < 2:
                 return False, None, "至少需要两个工况数据才能生成综合骨架曲线"
             
-            # 记录详细的工况数据信息
-            logging.info(f"开始生成多工况骨架曲线，工况数量: {len(self.workcase_data)}")
+            # 工况未变化且阈值已计算过时直接返回缓存结果
+            key = (self._workcase_version, float(displacement_threshold))
+            cached = self._skeleton_cache.get(key)
+            if cached is not None:
+                self._skeleton_cache.move_to_end(key)
+                self.skeleton_data = cached
+                return True, self.skeleton_data, "成功生成多工况综合骨架曲线"
             
-            # 2. 收集所有工况的峰值点
-            all_skeleton_points = []
+            logger.info("开始生成多工况骨架曲线，工况数量: %d", len(self.workcase_data))
             
-            # 添加原点作为基准点
-            all_skeleton_points.append((0.0, 0.0))
-            logging.info("添加原点(0.0, 0.0)作为基准点")
+            # 2. 收集所有工况的非异常峰值点
+            clean_disp, clean_force = self._get_clean_peaks()
+            logger.debug("总共收集到 %d 个特征点", len(clean_disp) + 1)
             
-            # 遍历所有工况数据
-            for i, workcase in enumerate(self.workcase_data):
-                workcase_name = workcase.get('name', f"工况 {i+1}")
-                logging.info(f"处理工况 {i+1}: {workcase_name}")
-                
-                # 检查工况数据是否有效
-                if not workcase.get('cycle_features'):
-                    logging.warning(f"工况 {workcase_name} 没有特征点数据，已跳过")
-                    continue
-                
-                # 从工况的循环特征中提取峰值点
-                workcase_points = []
-                for cycle_num, features in workcase['cycle_features'].items():
-                    # 添加正向峰值点
-                    if 'positive_peak' in features and features['positive_peak'] is not None:
-                        if not features.get('anomaly', False):  # 排除标记为异常的点
-                            pos_peak = features['positive_peak']
-                            workcase_points.append(pos_peak)
-                            logging.info(f"  添加正峰值点: 循环{cycle_num}, 坐标{pos_peak}")
-                    
-                    # 添加负向峰值点
-                    if 'negative_peak' in features and features['negative_peak'] is not None:
-                        if not features.get('anomaly', False):  # 排除标记为异常的点
-                            neg_peak = features['negative_peak']
-                            workcase_points.append(neg_peak)
-                            logging.info(f"  添加负峰值点: 循环{cycle_num}, 坐标{neg_peak}")
-                
-                logging.info(f"工况 {workcase_name} 提取了 {len(workcase_points)} 个特征点")
-                all_skeleton_points.extend(workcase_points)
-            
-            # 3. 点集处理
-            logging.info(f"总共收集到 {len(all_skeleton_points)} 个特征点")
-            # 按照位移值从小到大排序所有峰值点
-            all_skeleton_points.sort(key=lambda p: p[0])
-            
-            # 去除重复和过于接近的点
-            filtered_points = []
-            for point in all_skeleton_points:
-                # 检查是否与已添加的点过于接近
-                is_close = False
-                for existing_point in filtered_points:
-                    if abs(point[0] - existing_point[0]) < displacement_threshold:
-                        is_close = True
-                        logging.info(f"过滤接近点: {point} 接近于 {existing_point}")
-                        break
-                
-                if not is_close:
-                    filtered_points.append(point)
+            # 3. 点集处理：加入原点，排序并去除过于接近的点
+            d, f = _envelope_points(clean_disp, clean_force, displacement_threshold)
             
-            logging.info(f"过滤后剩余 {len(filtered_points)} 个特征点")
+            logger.debug("过滤后剩余 %d 个特征点", len(d))
             
             # 4. 生成骨架曲线
             # 检查是否有足够的点生成骨架曲线
-            if len(filtered_points) >= 2:
-                skeleton_disp, skeleton_force = zip(*filtered_points)
-                logging.info(f"生成的骨架曲线位移值: {skeleton_disp}")
-                logging.info(f"生成的骨架曲线力值: {skeleton_force}")
-                skeleton_data = (np.array(skeleton_disp), np.array(skeleton_force))
+            if len(d) >= 2:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("骨架曲线点数=%d, 位移范围=[%g, %g]", len(d), d.min(), d.max())
+                skeleton_data = (d, f)
                 self.skeleton_data = skeleton_data  # 更新类的骨架曲线数据
+                self._skeleton_cache[key] = skeleton_data
+                while len(self._skeleton_cache) > self.skeleton_cache_size:
+                    self._skeleton_cache.popitem(last=False)
                 return True, skeleton_data, "成功生成多工况综合骨架曲线"
             else:
                 return False, None, "点数不足，无法生成有效的骨架曲线"
@@ -584,8 +1494,6 @@ class HysteresisData:
             tuple: (success, message)
         """
         try:
-            import copy
-            
             # 检查是否有处理过的数据
             if self.processed_data is None:
                 return False, "没有处理过的数据可添加"
@@ -599,7 +1507,7 @@ class HysteresisData:
                 self.analyze_cycle_features()
                 
             # 创建工况名称
-            file_name = os.path.basename(self.file_path) if self.file_path else None
+            file_name = self.file_name
             name = f"工况 {len(self.workcase_data) + 1}"
             if file_name:
                 name = f"{name} ({file_name})"
@@ -607,23 +1515,24 @@ class HysteresisData:
             # 记录当前参数
             current_parameters = {}
             if hasattr(self, 'params'):
-                current_parameters = copy.deepcopy(self.params)
+                current_parameters = _fast_clone(self.params)
             
-            # 创建工况数据(深拷贝，避免后续修改影响已保存的工况)
+            # 创建工况数据(复制可写数据，避免后续修改影响已保存的工况)
             workcase = {
                 'name': name,
                 'file_name': file_name,
                 'file_path': self.file_path,
-                'processed_data': copy.deepcopy(self.processed_data),
-                'cycles': copy.deepcopy(self.cycles),
-                'cycle_features': copy.deepcopy(self.cycle_features),
+                'processed_data': _fast_clone(self.processed_data),
+                'cycles': _fast_clone(self.cycles),
+                'cycle_table': _fast_clone(self.cycle_table),
+                'cycle_features': _fast_clone(self.cycle_features),
                 'parameters': current_parameters
             }
             
             # 添加到工况数据列表
-            self.workcase_data.append(workcase)
+            self._append_workcase(workcase)
             
-            logging.info(f"成功添加工况: {name}, 当前工况总数: {len(self.workcase_data)}")
+            logger.info("成功添加工况: %s, 当前工况总数: %d", name, len(self.workcase_data))
             
             return True, f"已添加工况: {name}\n当前工况总数: {len(self.workcase_data)}"
             
@@ -634,4 +1543,4 @@ class HysteresisData:
             
     def clear_workcase_data(self):
         """清空工况数据"""
-        self.workcase_data = []
\ No newline at end of file
+        self._reset_workcases()
\ No newline at end of file
@@ -6,14 +6,27 @@
 
 import tkinter as tk
 from tkinter import ttk
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-import matplotlib.pyplot as plt
+from tkinter import font as tkfont
+from tkinter import filedialog
 import logging
+from functools import partial
 
 # 获取日志记录器
 logger = logging.getLogger(__name__)
 
+# 结果区域保留的最大行数，超出时删除最早的内容
+RESULT_MAX_LINES = 5000
+
+def _safe_int(var, default):
+    """读取变量并转换为整数，内容为空时返回默认值"""
+    text = var.get()
+    return int(text) if text else default
+
+def _safe_float(var, default):
+    """读取变量并转换为浮点数，内容为空时返回默认值"""
+    text = var.get()
+    return float(text) if text else default
+
 class HysteresisGUI:
     """滞回曲线分析工具的图形界面管理类"""
     
@@ -32,6 +45,14 @@ class HysteresisGUI:
         # 初始化组件变量
         self.init_variables()
         
+        # 按钮登记表 {控制器方法名: 按钮}
+        self._buttons = {}
+        
+        # 创建底部状态栏（先于主框架布局，保证窗口缩小时仍可见）
+        self.status_label = ttk.Label(self.master, textvariable=self.status_var,
+                                      relief=tk.SUNKEN, anchor=tk.W, padding=(5, 2))
+        self.status_label.pack(side=tk.BOTTOM, fill=tk.X)
+        
         # 创建主框架
         self.main_frame = ttk.Frame(self.master, padding=5)
         self.main_frame.pack(fill=tk.BOTH, expand=True)
@@ -74,6 +95,9 @@ class HysteresisGUI:
         # 文件信息变量
         self.file_info_var = tk.StringVar(value="未选择文件")
         
+        # 状态栏变量
+        self.status_var = tk.StringVar(value="就绪")
+        
         # 单位选择变量
         self.disp_units = ["mm", "cm", "m", "in"]
         self.force_units = ["N", "kN", "lbf"]
@@ -91,33 +115,162 @@ class HysteresisGUI:
         
         # 文件读取设置变量
         self.skiprows_var = tk.StringVar(value="0")
+        self.workers_var = tk.StringVar(value="4")
+        self.selected_only_var = tk.BooleanVar(value=False)
+        
+        # 结果区域待写入的文本，空闲时一次写入
+        self._result_buffer = []
+        self._flush_scheduled = False
+        
+        # 防抖回调的待执行任务 {控制器方法名: after任务ID}
+        self._debounce_ids = {}
+        
+        # 最近一次设置到通道下拉框的选项
+        self._last_channels = None
+        
+        # get_values的结果缓存，任一设置变量被修改后失效
+        self._values_cache = None
+        for var in (self.skiprows_var, self.disp_channel_var, self.force1_channel_var,
+                    self.force2_channel_var, self.disp_unit_var, self.force_unit_var,
+                    self.cycle_count_var, self.peak_prominence_var):
+            var.trace_add('write', self._invalidate_values)
     
     def setup_chinese_font(self):
-        """设置中文字体"""
-        self.default_font = ('SimHei', 9)
+        """设置中文字体
+        
+        创建一个命名字体供所有ttk组件和结果文本框共用，字体只解析一次
+        """
+        self.default_font = tkfont.Font(root=self.master, name='hysteresisDefault',
+                                        family='SimHei', size=10)
+        ttk.Style(self.master).configure('.', font=self.default_font)
     
     def create_plot_area(self):
-        """创建图表区域"""
+        """创建图表区域
+        
+        启动时只保留空的图表框架，图形、画布和工具栏在首次绘图时才创建
+        """
+        self._fig = None
+        self._canvas = None
+        # 最近一次完整绘制后的画布背景，用于局部刷新时的blit
+        self._background = None
+    
+    def _ensure_canvas(self):
+        """首次访问时创建matplotlib图形、画布和工具栏"""
+        if self._canvas is not None:
+            return
+        
+        logger.debug("创建图表画布")
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        
         # 使用更大的图形尺寸
-        self.fig = Figure(figsize=(10, 8), dpi=100)
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.plot_frame)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        # 添加工具栏
-        toolbar_frame = tk.Frame(self.plot_frame)
-        toolbar_frame.pack(side=tk.BOTTOM, fill=tk.X)
-        toolbar = NavigationToolbar2Tk(self.canvas, toolbar_frame)
+        self._fig = Figure(figsize=(10, 8), dpi=100)
+        self._canvas = FigureCanvasTkAgg(self._fig, master=self.plot_frame)
+        self._canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        # 添加精简工具栏，完整的matplotlib导航工具栏在需要缩放/平移时才创建
+        self.toolbar_frame = tk.Frame(self.plot_frame)
+        self.toolbar_frame.pack(side=tk.BOTTOM, fill=tk.X)
+        self._mini_toolbar = ttk.Frame(self.toolbar_frame)
+        self._mini_toolbar.pack(side=tk.LEFT)
+        ttk.Button(self._mini_toolbar, text="复位视图",
+                   command=self._reset_view).pack(side=tk.LEFT, padx=2, pady=2)
+        ttk.Button(self._mini_toolbar, text="保存图片",
+                   command=self._save_figure).pack(side=tk.LEFT, padx=2, pady=2)
+        ttk.Button(self._mini_toolbar, text="缩放/平移",
+                   command=self._show_full_toolbar).pack(side=tk.LEFT, padx=2, pady=2)
+        
+        # 完整绘制或窗口尺寸变化后缓存的背景失效，下次blit时再重新截取
+        self._canvas.mpl_connect('draw_event', self._invalidate_background)
+        self._canvas.get_tk_widget().bind('<Configure>', self._invalidate_background, add='+')
+    
+    def _reset_view(self):
+        """按数据范围重新设置所有坐标轴"""
+        for ax in self._fig.axes:
+            ax.relim()
+            ax.autoscale()
+        self.request_redraw()
+    
+    def _save_figure(self):
+        """将当前图形保存为图片"""
+        file_path = filedialog.asksaveasfilename(
+            title="保存图片",
+            defaultextension=".png",
+            filetypes=[("PNG图片", "*.png"), ("PDF文件", "*.pdf"), ("SVG图片", "*.svg")]
+        )
+        if file_path:
+            self._fig.savefig(file_path, dpi=150)
+            self.set_status(f"图片已保存: {file_path}")
+    
+    def _show_full_toolbar(self):
+        """用matplotlib完整导航工具栏替换精简工具栏"""
+        from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk
+        
+        logger.debug("创建完整导航工具栏")
+        self._mini_toolbar.destroy()
+        toolbar = NavigationToolbar2Tk(self._canvas, self.toolbar_frame)
         toolbar.update()
     
+    def _invalidate_background(self, event=None):
+        """图形重绘或画布尺寸变化后缓存的背景不再可用"""
+        self._background = None
+    
+    def request_redraw(self):
+        """请求在下一次空闲时重绘画布
+        
+        同一事件循环内的多次请求只触发一次渲染；画布尚未创建时无需重绘
+        """
+        if self._canvas is not None:
+            self._canvas.draw_idle()
+    
+    def blit_artists(self, *artists):
+        """只重绘指定的动态图形元素（如标记点、光标线）
+        
+        元素应设置animated=True，使其不进入缓存的背景；
+        背景在首次blit时才截取，之后直到图形重绘前都可复用
+        
+        参数:
+            artists: 需要重绘的matplotlib图形元素
+        """
+        if self._canvas is None:
+            return
+        if self._background is None:
+            # draw()触发的draw_event会先清除旧背景，随后截取新背景
+            self._canvas.draw()
+            self._background = self._canvas.copy_from_bbox(self._fig.bbox)
+        
+        self._canvas.restore_region(self._background)
+        for artist in artists:
+            artist.axes.draw_artist(artist)
+        self._canvas.blit(self._fig.bbox)
+    
+    @property
+    def fig(self):
+        """matplotlib图形，首次访问时创建"""
+        self._ensure_canvas()
+        return self._fig
+    
+    @property
+    def canvas(self):
+        """matplotlib画布，首次访问时创建"""
+        self._ensure_canvas()
+        return self._canvas
+    
     def create_result_area(self):
         """创建结果显示区域"""
-        # 已经在__init__中创建了结果框架，这里只创建文本区域
-        self.result_text = tk.Text(self.result_frame, height=8, font=('SimHei', 10))
-        self.result_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        # 已经在__init__中创建了结果框架，这里创建文本区域和滚动条
+        # 滚动条与文本框并列放在同一框架中，插入文本时不会引起滚动条重绘
+        text_frame = ttk.Frame(self.result_frame)
+        text_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        text_frame.rowconfigure(0, weight=1)
+        text_frame.columnconfigure(0, weight=1)
+        
+        self.result_text = tk.Text(text_frame, height=8, font=self.default_font)
+        self.result_text.grid(row=0, column=0, sticky='nsew')
         
         # 添加滚动条
-        scrollbar = ttk.Scrollbar(self.result_text, command=self.result_text.yview)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        scrollbar = ttk.Scrollbar(text_frame, command=self.result_text.yview)
+        scrollbar.grid(row=0, column=1, sticky='ns')
         self.result_text.config(yscrollcommand=scrollbar.set)
     
     def create_file_selection_area(self):
@@ -125,102 +278,94 @@ class HysteresisGUI:
         logger.debug("创建文件选择区域")
         file_frame = ttk.LabelFrame(self.control_frame, text="文件选择")
         file_frame.pack(fill=tk.X, padx=5, pady=5)
+        file_frame.columnconfigure((0, 1, 2), weight=1)
         
         # 创建按钮并添加点击日志
-        load_file_btn = ttk.Button(file_frame, text="选择单个文件", 
-                  command=lambda: self.log_button_click("选择单个文件", self.controller.load_file))
-        load_file_btn.pack(side=tk.LEFT, padx=5, pady=5)
-        
-        load_multiple_btn = ttk.Button(file_frame, text="选择多个文件", 
-                  command=lambda: self.log_button_click("选择多个文件", self.controller.load_multiple_files))
-        load_multiple_btn.pack(side=tk.LEFT, padx=5, pady=5)
-        
-        load_folder_btn = ttk.Button(file_frame, text="选择文件夹", 
-                  command=lambda: self.log_button_click("选择文件夹", self.controller.load_folder))
-        load_folder_btn.pack(side=tk.LEFT, padx=5, pady=5)
+        self.create_button(file_frame, "选择单个文件", "load_file").grid(row=0, column=0, sticky='ew', padx=5, pady=5)
+        self.create_button(file_frame, "选择多个文件", "load_multiple_files").grid(row=0, column=1, sticky='ew', padx=5, pady=5)
+        self.create_button(file_frame, "选择文件夹", "load_folder").grid(row=0, column=2, sticky='ew', padx=5, pady=5)
         
         # 文件读取设置
         file_setting_frame = ttk.Frame(file_frame)
-        file_setting_frame.pack(fill=tk.X, padx=5, pady=5)
+        file_setting_frame.grid(row=1, column=0, columnspan=3, sticky='ew', padx=5, pady=5)
         
-        ttk.Label(file_setting_frame, text="跳过数据前几行:").pack(side=tk.LEFT)
+        ttk.Label(file_setting_frame, text="跳过数据前几行:").grid(row=0, column=0)
         self.skiprows_entry = ttk.Entry(file_setting_frame, textvariable=self.skiprows_var, width=5)
-        self.skiprows_entry.pack(side=tk.LEFT, padx=5)
-        apply_btn = ttk.Button(file_setting_frame, text="应用", 
-                  command=lambda: self.log_button_click("应用跳过行设置", self.controller.apply_skiprows))
-        apply_btn.pack(side=tk.LEFT, padx=5)
+        self.skiprows_entry.grid(row=0, column=1, padx=5)
+        self.create_button(file_setting_frame, "应用", "apply_skiprows",
+                           label="应用跳过行设置").grid(row=0, column=2, padx=5)
         
         # 添加提示说明
         ttk.Label(file_setting_frame, text="(不包括标题行)", 
-                 foreground="gray").pack(side=tk.LEFT, padx=5)
+                 foreground="gray").grid(row=0, column=3, padx=5)
+        
+        # 文件夹并行读取设置
+        workers_frame = ttk.Frame(file_frame)
+        workers_frame.grid(row=2, column=0, columnspan=3, sticky='ew', padx=5, pady=5)
+        ttk.Label(workers_frame, text="并行读取进程数:").grid(row=0, column=0)
+        self.workers_entry = ttk.Entry(workers_frame, textvariable=self.workers_var, width=5)
+        self.workers_entry.grid(row=0, column=1, padx=5)
+        
+        # 加载文件时只读取当前选择的通道
+        ttk.Checkbutton(file_frame, text="只读取所选通道",
+                        variable=self.selected_only_var).grid(row=3, column=0, columnspan=3, sticky='w', padx=5)
         
         # 文件信息显示
         ttk.Label(file_frame, textvariable=self.file_info_var, 
-                 wraplength=250).pack(fill=tk.X, padx=5, pady=5)
+                 wraplength=250).grid(row=4, column=0, columnspan=3, sticky='ew', padx=5, pady=5)
         
         # 文件导航（当有多个文件时）
         self.file_nav_frame = ttk.Frame(file_frame)
-        self.file_nav_frame.pack(fill=tk.X, padx=5, pady=5)
-        self.prev_file_btn = ttk.Button(self.file_nav_frame, text="上一个文件", 
-                  command=lambda: self.log_button_click("上一个文件", 
-                                 lambda: self.controller.prev_file() if self.controller else None))
-        self.prev_file_btn.pack(side=tk.LEFT, padx=5)
-        self.next_file_btn = ttk.Button(self.file_nav_frame, text="下一个文件", 
-                  command=lambda: self.log_button_click("下一个文件", 
-                                 lambda: self.controller.next_file() if self.controller else None))
-        self.next_file_btn.pack(side=tk.LEFT, padx=5)
-        self.file_nav_frame.pack_forget()  # 默认隐藏
+        self.file_nav_frame.grid(row=5, column=0, columnspan=3, sticky='ew', padx=5, pady=5)
+        self.prev_file_btn = self.create_button(self.file_nav_frame, "上一个文件", "prev_file")
+        self.prev_file_btn.grid(row=0, column=0, padx=5)
+        self.next_file_btn = self.create_button(self.file_nav_frame, "下一个文件", "next_file")
+        self.next_file_btn.grid(row=0, column=1, padx=5)
+        self.file_nav_frame.grid_remove()  # 默认隐藏，保留布局参数以便再次显示
+        self._nav_visible = False
     
     def create_channel_selection_area(self):
         """创建通道选择区域"""
         channel_frame = ttk.LabelFrame(self.control_frame, text="通道选择")
         channel_frame.pack(fill=tk.X, padx=5, pady=5)
+        channel_frame.columnconfigure(1, weight=1)
         
         # 位移通道
-        disp_frame = ttk.Frame(channel_frame)
-        disp_frame.pack(fill=tk.X, padx=5, pady=5)
-        ttk.Label(disp_frame, text="位移通道:").pack(side=tk.LEFT)
-        self.disp_channel_combo = ttk.Combobox(disp_frame, textvariable=self.disp_channel_var, state="readonly")
-        self.disp_channel_combo.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
+        ttk.Label(channel_frame, text="位移通道:").grid(row=0, column=0, sticky='w', padx=5, pady=5)
+        self.disp_channel_combo = ttk.Combobox(channel_frame, textvariable=self.disp_channel_var, state="readonly")
+        self.disp_channel_combo.grid(row=0, column=1, sticky='ew', padx=5, pady=5)
         
         # 力传感器通道1
-        force1_frame = ttk.Frame(channel_frame)
-        force1_frame.pack(fill=tk.X, padx=5, pady=5)
-        ttk.Label(force1_frame, text="力传感器通道1:").pack(side=tk.LEFT)
-        self.force1_channel_combo = ttk.Combobox(force1_frame, textvariable=self.force1_channel_var, state="readonly")
-        self.force1_channel_combo.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
+        ttk.Label(channel_frame, text="力传感器通道1:").grid(row=1, column=0, sticky='w', padx=5, pady=5)
+        self.force1_channel_combo = ttk.Combobox(channel_frame, textvariable=self.force1_channel_var, state="readonly")
+        self.force1_channel_combo.grid(row=1, column=1, sticky='ew', padx=5, pady=5)
         
         # 力传感器通道2
-        force2_frame = ttk.Frame(channel_frame)
-        force2_frame.pack(fill=tk.X, padx=5, pady=5)
-        ttk.Label(force2_frame, text="力传感器通道2:").pack(side=tk.LEFT)
-        self.force2_channel_combo = ttk.Combobox(force2_frame, textvariable=self.force2_channel_var, state="readonly")
-        self.force2_channel_combo.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
+        ttk.Label(channel_frame, text="力传感器通道2:").grid(row=2, column=0, sticky='w', padx=5, pady=5)
+        self.force2_channel_combo = ttk.Combobox(channel_frame, textvariable=self.force2_channel_var, state="readonly")
+        self.force2_channel_combo.grid(row=2, column=1, sticky='ew', padx=5, pady=5)
     
     def create_unit_settings_area(self):
         """创建单位设置区域"""
         unit_frame = ttk.LabelFrame(self.control_frame, text="单位设置")
         unit_frame.pack(fill=tk.X, padx=5, pady=5)
+        unit_frame.columnconfigure(1, weight=1)
         
         # 位移单位
-        disp_unit_frame = ttk.Frame(unit_frame)
-        disp_unit_frame.pack(fill=tk.X, padx=5, pady=5)
-        ttk.Label(disp_unit_frame, text="位移单位:").pack(side=tk.LEFT)
-        self.disp_unit_combo = ttk.Combobox(disp_unit_frame, textvariable=self.disp_unit_var, 
+        ttk.Label(unit_frame, text="位移单位:").grid(row=0, column=0, sticky='w', padx=5, pady=5)
+        self.disp_unit_combo = ttk.Combobox(unit_frame, textvariable=self.disp_unit_var, 
                                           values=self.disp_units, state="readonly", width=10)
-        self.disp_unit_combo.pack(side=tk.LEFT, padx=5)
+        self.disp_unit_combo.grid(row=0, column=1, sticky='w', padx=5, pady=5)
         self.disp_unit_combo.bind("<<ComboboxSelected>>", 
-                                 lambda e: self.controller.update_units())
+                                 lambda e: self._debounce_update_units())
         
         # 力单位
-        force_unit_frame = ttk.Frame(unit_frame)
-        force_unit_frame.pack(fill=tk.X, padx=5, pady=5)
-        ttk.Label(force_unit_frame, text="力单位:").pack(side=tk.LEFT)
-        self.force_unit_combo = ttk.Combobox(force_unit_frame, textvariable=self.force_unit_var, 
+        ttk.Label(unit_frame, text="力单位:").grid(row=1, column=0, sticky='w', padx=5, pady=5)
+        self.force_unit_combo = ttk.Combobox(unit_frame, textvariable=self.force_unit_var, 
                                            values=self.force_units, state="readonly", width=10)
-        self.force_unit_combo.pack(side=tk.LEFT, padx=5)
+        self.force_unit_combo.grid(row=1, column=1, sticky='w', padx=5, pady=5)
         self.force_unit_combo.bind("<<ComboboxSelected>>", 
-                                  lambda e: self.controller.update_units())
+                                  lambda e: self._debounce_update_units())
     
     def create_cycle_settings_area(self):
         """创建循环加载设置区域"""
@@ -247,15 +392,12 @@ class HysteresisGUI:
         button_frame.pack(fill=tk.X, padx=5, pady=10)
         
         # A all buttons are in the same row, add logging
-        ttk.Button(button_frame, text="1.绘制滞回曲线", 
-                  command=lambda: self.log_button_click("绘制滞回曲线", self.controller.draw_raw_hysteresis), 
-                  width=14).pack(side=tk.LEFT, padx=3, pady=5)
-        ttk.Button(button_frame, text="2.处理数据", 
-                  command=lambda: self.log_button_click("处理数据", self.controller.process_data), 
-                  width=14).pack(side=tk.LEFT, padx=3, pady=5)
-        ttk.Button(button_frame, text="3.计算等效刚度", 
-                  command=lambda: self.log_button_click("计算等效刚度", self.controller.show_equivalent_stiffness), 
-                  width=14).pack(side=tk.LEFT, padx=3, pady=5)
+        self.create_button(button_frame, "1.绘制滞回曲线", "draw_raw_hysteresis",
+                           label="绘制滞回曲线", width=14).pack(side=tk.LEFT, padx=3, pady=5)
+        self.create_button(button_frame, "2.处理数据", "process_data",
+                           label="处理数据", width=14).pack(side=tk.LEFT, padx=3, pady=5)
+        self.create_button(button_frame, "3.计算等效刚度", "show_equivalent_stiffness",
+                           label="计算等效刚度", width=14).pack(side=tk.LEFT, padx=3, pady=5)
     
     def create_workcase_management_area(self):
         """创建工况管理区域"""
@@ -268,119 +410,174 @@ class HysteresisGUI:
         batch_frame.pack(fill=tk.X, padx=5, pady=5)
         
         # 添加按钮，带日志记录
-        ttk.Button(batch_frame, text="批量处理文件", 
-                  command=lambda: self.log_button_click("批量处理文件", self.controller.batch_process_all), 
-                  width=15).pack(side=tk.LEFT, padx=5, pady=5)
-        ttk.Button(batch_frame, text="多文件比较", 
-                  command=lambda: self.log_button_click("多文件比较", self.controller.show_multi_raw_comparison), 
-                  width=15).pack(side=tk.LEFT, padx=5, pady=5)
-        ttk.Button(batch_frame, text="导出结果", 
-                  command=lambda: self.log_button_click("导出结果", self.controller.export_results), 
-                  width=15).pack(side=tk.LEFT, padx=5, pady=5)
+        self.create_button(batch_frame, "批量处理文件", "batch_process_all",
+                           width=15).pack(side=tk.LEFT, padx=5, pady=5)
+        self.create_button(batch_frame, "多文件比较", "show_multi_raw_comparison",
+                           width=15).pack(side=tk.LEFT, padx=5, pady=5)
+        self.create_button(batch_frame, "导出结果", "export_results",
+                           width=15).pack(side=tk.LEFT, padx=5, pady=5)
+    
+    def _debounce(self, callback_name, delay=80):
+        """延迟调用控制器方法，短时间内的连续触发只执行最后一次
+        
+        参数:
+            callback_name: 控制器方法名
+            delay: 延迟时间（毫秒）
+        """
+        after_id = self._debounce_ids.get(callback_name)
+        if after_id is not None:
+            self.master.after_cancel(after_id)
+        self._debounce_ids[callback_name] = self.master.after(
+            delay, self._run_debounced, callback_name)
+    
+    def _run_debounced(self, callback_name):
+        """执行防抖后的控制器方法"""
+        self._debounce_ids.pop(callback_name, None)
+        getattr(self.controller, callback_name)()
+    
+    def _debounce_update_units(self):
+        """单位下拉框快速切换时只在最后一次选择后更新单位"""
+        self._debounce("update_units")
     
     def update_file_info(self, info_text):
         """更新文件信息显示"""
-        logger.debug(f"更新文件信息: {info_text}")
+        logger.debug("更新文件信息: %s", info_text)
         self.file_info_var.set(info_text)
     
+    def set_status(self, text):
+        """更新状态栏文本，用于替代非错误提示的弹窗"""
+        logger.debug("更新状态栏: %s", text)
+        self.status_var.set(text)
+    
     def update_result(self, text):
-        """向结果区域添加文本"""
-        logger.debug(f"更新结果区域: {text[:50]}...")  # 只记录前50个字符，避免日志过长
-        self.result_text.insert(tk.END, text)
+        """向结果区域添加文本
+        
+        文本先放入缓冲区，界面空闲时合并为一次插入和滚动
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("更新结果区域: %s...", text[:50])  # 只记录前50个字符，避免日志过长
+        self._result_buffer.append(text)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.master.after_idle(self._flush_result)
+    
+    def _flush_result(self):
+        """将缓冲区中的文本一次写入结果区域"""
+        self._flush_scheduled = False
+        if not self._result_buffer:
+            return
+        self.result_text.insert(tk.END, "".join(self._result_buffer))
+        self._result_buffer.clear()
+        
+        # 限制文本总行数，避免长时间批量处理后插入和滚动变慢
+        lines = int(self.result_text.index('end-1c').split('.')[0])
+        if lines > RESULT_MAX_LINES:
+            self.result_text.delete('1.0', f'{lines - RESULT_MAX_LINES + 1}.0')
         self.result_text.see(tk.END)
     
     def clear_result(self):
         """清空结果区域"""
         logger.debug("清空结果区域")
+        self._result_buffer.clear()
         self.result_text.delete(1.0, tk.END)
     
     def show_file_navigation(self, show=True):
-        """显示或隐藏文件导航按钮"""
+        """显示或隐藏文件导航按钮，显示状态未变化时不做处理"""
+        if show == self._nav_visible:
+            return
+        self._nav_visible = show
         if show:
             logger.debug("显示文件导航按钮")
-            self.file_nav_frame.pack(fill=tk.X, padx=5, pady=5)
+            self.file_nav_frame.grid()
         else:
             logger.debug("隐藏文件导航按钮")
-            self.file_nav_frame.pack_forget()
+            self.file_nav_frame.grid_remove()
     
     def update_channel_options(self, channels):
         """更新通道选择下拉框的选项"""
-        logger.debug(f"更新通道选项，共 {len(channels)} 个通道")
-        self.disp_channel_combo['values'] = channels
-        self.force1_channel_combo['values'] = channels
-        self.force2_channel_combo['values'] = channels
-        
-        # 如果当前值不在选项中，设置为第一个选项
-        if self.disp_channel_var.get() not in channels and channels:
-            logger.debug(f"设置默认位移通道: {channels[0]}")
+        logger.debug("更新通道选项，共 %d 个通道", len(channels))
+        
+        # 只转换一次并由三个下拉框共用；通道与上次相同时不再重新赋值
+        channels = tuple(map(str, channels))
+        if channels != self._last_channels:
+            self._last_channels = channels
+            self.disp_channel_combo['values'] = channels
+            self.force1_channel_combo['values'] = channels
+            self.force2_channel_combo['values'] = channels
+        
+        if not channels:
+            return
+        
+        # 如果当前值不在选项中，设置为第一个选项；值已正确时不再写入变量
+        channel_set = set(channels)
+        if self.disp_channel_var.get() not in channel_set:
+            logger.debug("设置默认位移通道: %s", channels[0])
             self.disp_channel_var.set(channels[0])
-        if self.force1_channel_var.get() not in channels and channels:
-            logger.debug(f"设置默认力通道1: {channels[0]}")
+        if self.force1_channel_var.get() not in channel_set:
+            logger.debug("设置默认力通道1: %s", channels[0])
             self.force1_channel_var.set(channels[0])
-        if self.force2_channel_var.get() not in channels and channels:
+        force2_channel = self.force2_channel_var.get()
+        if force2_channel and force2_channel not in channel_set:
             logger.debug("清空力通道2")
             self.force2_channel_var.set("")
     
+    def _invalidate_values(self, *args):
+        """设置变量被修改时清除get_values的缓存"""
+        self._values_cache = None
+    
     def get_values(self):
-        """获取所有GUI设置值"""
+        """获取所有GUI设置值
+        
+        数值设置只在变量修改后解析一次，之后直接返回缓存结果
+        """
+        if self._values_cache is not None:
+            return dict(self._values_cache)
+        
         values = {
-            'skiprows': int(self.skiprows_var.get() or 0),
+            'skiprows': _safe_int(self.skiprows_var, 0),
             'disp_channel': self.disp_channel_var.get(),
             'force1_channel': self.force1_channel_var.get(),
             'force2_channel': self.force2_channel_var.get(),
             'disp_unit': self.disp_unit_var.get(),
             'force_unit': self.force_unit_var.get(),
-            'cycle_count': int(self.cycle_count_var.get() or 3),
-            'peak_prominence': float(self.peak_prominence_var.get() or 0.1)
+            'cycle_count': _safe_int(self.cycle_count_var, 3),
+            'peak_prominence': _safe_float(self.peak_prominence_var, 0.1)
         }
-        logger.debug(f"获取GUI设置值: {values}")
-        return values
+        logger.debug("获取GUI设置值: %s", values)
+        self._values_cache = values
+        return dict(values)
+    
+    def create_button(self, parent, text, callback_name, label=None, **kwargs):
+        """创建按钮并登记，点击时记录日志并调用控制器的对应方法
+        
+        控制器方法在点击时才按名称查找，更换控制器后无需重新绑定按钮
+        
+        参数:
+            parent: 父组件
+            text: 按钮文本
+            callback_name: 控制器方法名，同时作为按钮在登记表中的名称
+            label: 日志中的按钮名称，默认与按钮文本相同
+            **kwargs: 传给ttk.Button的其他参数
+            
+        返回:
+            ttk.Button: 创建的按钮
+        """
+        button = ttk.Button(parent, text=text,
+                            command=partial(self.log_button_click, label or text, callback_name),
+                            **kwargs)
+        self._buttons[callback_name] = button
+        return button
     
     def rebind_buttons(self, controller):
         """重新绑定按钮到新的控制器
         
+        按钮点击时按名称查找控制器方法，这里只需更换控制器
+        
         参数:
             controller: 新的控制器对象
         """
-        logger.info(f"重新绑定按钮到控制器: {controller.__class__.__name__}")
-        # 直接重新绑定文件导航按钮
-        self.prev_file_btn.config(command=lambda: self.log_button_click("上一个文件", controller.prev_file))
-        self.next_file_btn.config(command=lambda: self.log_button_click("下一个文件", controller.next_file))
-        
-        # 更新所有子窗口中的按钮绑定
-        for widget in self.control_frame.winfo_children():
-            if isinstance(widget, ttk.LabelFrame):
-                for child in widget.winfo_children():
-                    if isinstance(child, ttk.Button):
-                        # 判断按钮文本，重新绑定对应的函数
-                        if child['text'] == "选择单个文件":
-                            child.config(command=lambda: self.log_button_click("选择单个文件", controller.load_file))
-                        elif child['text'] == "选择多个文件":
-                            child.config(command=lambda: self.log_button_click("选择多个文件", controller.load_multiple_files))
-                        elif child['text'] == "选择文件夹":
-                            child.config(command=lambda: self.log_button_click("选择文件夹", controller.load_folder))
-                        elif child['text'] == "应用":
-                            child.config(command=lambda: self.log_button_click("应用跳过行设置", controller.apply_skiprows))
-                        elif child['text'] == "1.绘制滞回曲线":
-                            child.config(command=lambda: self.log_button_click("绘制滞回曲线", controller.draw_raw_hysteresis))
-                        elif child['text'] == "2.处理数据":
-                            child.config(command=lambda: self.log_button_click("处理数据", controller.process_data))
-                        elif child['text'] == "3.计算等效刚度":
-                            child.config(command=lambda: self.log_button_click("计算等效刚度", controller.show_equivalent_stiffness))
-                        elif child['text'] == "添加为工况":
-                            child.config(command=lambda: self.log_button_click("添加为工况", controller.add_current_as_workcase))
-                        elif child['text'] == "生成多工况骨架曲线":
-                            child.config(command=lambda: self.log_button_click("生成多工况骨架曲线", controller.generate_multi_workcase_skeleton))
-                        elif child['text'] == "清空工况数据":
-                            child.config(command=lambda: self.log_button_click("清空工况数据", controller.clear_workcase_data))
-                        elif child['text'] == "生成骨架曲线":
-                            child.config(command=lambda: self.log_button_click("生成骨架曲线", controller.generate_skeleton_curve))
-                        elif child['text'] == "批量处理文件":
-                            child.config(command=lambda: self.log_button_click("批量处理文件", controller.batch_process_all))
-                        elif child['text'] == "多文件比较":
-                            child.config(command=lambda: self.log_button_click("多文件比较", controller.show_multi_raw_comparison))
-                        elif child['text'] == "导出结果":
-                            child.config(command=lambda: self.log_button_click("导出结果", controller.export_results))
+        logger.info("重新绑定按钮到控制器: %s", controller.__class__.__name__)
+        self.controller = controller
     
     def create_workcase_frame(self):
         """创建工况处理区域"""
@@ -390,38 +587,32 @@ class HysteresisGUI:
         workcase_frame.pack(fill=tk.X, pady=5, padx=5)
         
         # 添加为工况按钮，带日志记录
-        ttk.Button(workcase_frame, text="添加为工况", 
-                  command=lambda: self.log_button_click("添加为工况", 
-                                self.controller.add_current_as_workcase if self.controller else None), 
-                  width=15).pack(side=tk.LEFT, padx=5, pady=5)
+        self.create_button(workcase_frame, "添加为工况", "add_current_as_workcase",
+                           width=15).pack(side=tk.LEFT, padx=5, pady=5)
         
         # 生成多工况骨架曲线按钮，带日志记录
-        ttk.Button(workcase_frame, text="生成多工况骨架曲线", 
-                  command=lambda: self.log_button_click("生成多工况骨架曲线", 
-                                self.controller.generate_multi_workcase_skeleton if self.controller else None), 
-                  width=20).pack(side=tk.LEFT, padx=5, pady=5)
+        self.create_button(workcase_frame, "生成多工况骨架曲线", "generate_multi_workcase_skeleton",
+                           width=20).pack(side=tk.LEFT, padx=5, pady=5)
         
         # 清空工况数据按钮，带日志记录
-        ttk.Button(workcase_frame, text="清空工况数据", 
-                  command=lambda: self.log_button_click("清空工况数据", 
-                                self.controller.clear_workcase_data if self.controller else None), 
-                  width=15).pack(side=tk.LEFT, padx=5, pady=5)
+        self.create_button(workcase_frame, "清空工况数据", "clear_workcase_data",
+                           width=15).pack(side=tk.LEFT, padx=5, pady=5)
         
         return workcase_frame
 
     # 添加按钮点击日志记录的辅助方法
-    def log_button_click(self, button_name, callback_function):
-        """记录按钮点击并调用对应的回调函数
+    def log_button_click(self, button_name, callback_name):
+        """记录按钮点击并调用控制器的对应方法
         
         参数:
             button_name: 按钮名称
-            callback_function: 回调函数
+            callback_name: 控制器方法名
         """
-        logger.info(f"点击按钮: {button_name}")
+        logger.info("点击按钮: %s", button_name)
         try:
-            callback_function()
+            getattr(self.controller, callback_name)()
         except Exception as e:
-            logger.error(f"按钮 '{button_name}' 执行出错: {str(e)}", exc_info=True)
+            logger.error("按钮 '%s' 执行出错: %s", button_name, e, exc_info=True)
 
 # 定义一个临时控制器类
 class DummyController:
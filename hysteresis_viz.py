@@ -5,29 +5,182 @@
 """
 
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import numpy as np
 import os
 import utils_visualization as uv
+import utils_data as ud
 import logging
 
 logger = logging.getLogger(__name__)
 
+# tab10调色板，按循环序号取模后直接作为颜色数组使用
+_TAB10 = np.asarray(plt.cm.tab10.colors)
+
+# 曲线绘制的最大点数，超过时按区间保留极值点后再绘制
+PLOT_MAX_POINTS = 50_000
+
+def _decimate(displacement, force, max_points=PLOT_MAX_POINTS):
+    """对过长的曲线进行极值抽稀，只用于绘图
+    
+    将数据分为若干区间，每个区间保留位移和力的最小、最大值点，
+    按原顺序排列，曲线的外包络和峰值与原始数据一致
+    
+    参数:
+        displacement: 位移数据
+        force: 力数据
+        max_points: 抽稀后的最大点数
+        
+    返回:
+        tuple: (displacement, force)，未超过最大点数时原样返回
+    """
+    displacement = np.asarray(displacement)
+    force = np.asarray(force)
+    n = len(displacement)
+    if n <= max_points:
+        return displacement, force
+    
+    # 每个区间最多保留4个点
+    bin_size = -(-n // (max_points // 4))
+    n_bins = n // bin_size
+    trimmed = n_bins * bin_size
+    base = np.arange(n_bins) * bin_size
+    
+    picks = [np.arange(trimmed, n)]
+    for values in (displacement, force):
+        blocks = values[:trimmed].reshape(n_bins, bin_size)
+        picks.append(base + blocks.argmin(axis=1))
+        picks.append(base + blocks.argmax(axis=1))
+    index = np.unique(np.concatenate(picks))
+    return displacement[index], force[index]
+
+def _skeleton_arrays(skeleton_data):
+    """将骨架曲线数据 (位移数组, 力数组) 转换为两个浮点数组，没有数据时返回空数组"""
+    if skeleton_data is None:
+        return np.empty(0), np.empty(0)
+    skeleton_disp, skeleton_force = (np.asarray(a, dtype=np.float64) for a in skeleton_data)
+    return skeleton_disp, skeleton_force
+
+def _cycle_colors(count):
+    """返回count条曲线依次循环使用tab10调色板的颜色数组"""
+    return _TAB10[np.arange(count) % len(_TAB10)]
+
+def _cycle_ranges(cycles, *arrays):
+    """一次求出各循环区间 [start, end) 内的点数、最小值和最大值
+    
+    循环首尾相接时直接对连续数据分段reduceat，否则先按区间拼接下标取值；
+    区间下标只计算一次，供所有数组共用
+    
+    参数:
+        cycles: 循环起止索引列表
+        *arrays: 需要统计的数据数组
+        
+    返回:
+        tuple: (lengths, [(mins, maxs), ...])，每个数组对应一组最值
+    """
+    arrays = [np.asarray(values) for values in arrays]
+    if len(cycles) == 0:
+        return (np.empty(0, dtype=np.intp),
+                [(np.empty(0, dtype=v.dtype), np.empty(0, dtype=v.dtype)) for v in arrays])
+    
+    bounds = np.asarray(cycles, dtype=np.intp).reshape(-1, 2)
+    starts, ends = bounds[:, 0], bounds[:, 1]
+    lengths = ends - starts
+    if np.array_equal(starts[1:], ends[:-1]):
+        index = slice(starts[0], ends[-1])
+        offsets = starts - starts[0]
+    else:
+        offsets = np.cumsum(lengths) - lengths
+        index = np.repeat(starts - offsets, lengths) + np.arange(lengths.sum())
+    
+    ranges = []
+    for values in arrays:
+        segment = values[index]
+        ranges.append((np.minimum.reduceat(segment, offsets), np.maximum.reduceat(segment, offsets)))
+    return lengths, ranges
+
 class HysteresisViz:
     """滞回曲线可视化类"""
     
-    def __init__(self, figure, canvas, result_text):
+    def __init__(self, figure, canvas, result_view):
         """初始化可视化管理器
         
         参数:
             figure: Matplotlib图形对象
             canvas: Matplotlib画布
-            result_text: 结果文本组件
+            result_view: 结果显示对象，提供update_result和clear_result方法（通常为HysteresisGUI）
         """
         self.fig = figure
         self.canvas = canvas
-        self.result_text = result_text
+        self.result_view = result_view
         self.current_disp_unit = "mm"
         self.current_force_unit = "kN"
+        
+        # 使用constrained布局，绘制时自动调整子图间距，无需每次调用tight_layout
+        if hasattr(self.fig, "set_layout_engine"):
+            self.fig.set_layout_engine("constrained")
+        else:
+            self.fig.set_constrained_layout(True)
+        
+        # 当前图形布局及可复用的图形元素，切换文件时只更新数据
+        self._layout = None
+        self._ax = None
+        self._lines = {}
+        self._cycle_lines = []
+        self._skeleton_names = None
+        self._main_ax = None  # 单坐标轴布局的坐标轴，切换单坐标轴图形时复用
+    
+    def _reset_artists(self):
+        """丢弃缓存的图形元素"""
+        self._layout = None
+        self._ax = None
+        self._lines = {}
+        self._cycle_lines = []
+        self._skeleton_names = None
+    
+    def _clear_figure(self):
+        """清空图形并丢弃缓存的图形元素"""
+        self.fig.clear()
+        self._main_ax = None
+        self._reset_artists()
+    
+    def _single_axes(self):
+        """获取单坐标轴布局使用的坐标轴
+        
+        图形中只有上一次的单个坐标轴时用ax.cla()清空后复用，
+        不必清空整个图形并重新创建坐标轴；否则清空图形后创建
+        
+        返回:
+            Axes: 已清空的坐标轴
+        """
+        ax = self._main_ax
+        if ax is not None and self.fig.axes == [ax]:
+            ax.cla()
+            self._reset_artists()
+            return ax
+        
+        self._clear_figure()
+        self._main_ax = self.fig.add_subplot(111)
+        return self._main_ax
+    
+    def _setup_axes(self, ax, title):
+        """设置坐标轴标签、标题、网格和原点参考线"""
+        ax.set_xlabel(f"位移 ({self.current_disp_unit})")
+        ax.set_ylabel(f"力 ({self.current_force_unit})")
+        ax.set_title(title)
+        ax.grid(True, linestyle='--', alpha=0.7)
+        ax.axhline(y=0, color='k', linestyle='-', alpha=0.3)
+        ax.axvline(x=0, color='k', linestyle='-', alpha=0.3)
+    
+    def _update_axes(self):
+        """布局未变化时，更新单位标签和坐标范围并请求重绘"""
+        ax = self._ax
+        ax.set_xlabel(f"位移 ({self.current_disp_unit})")
+        ax.set_ylabel(f"力 ({self.current_force_unit})")
+        ax.relim()
+        ax.autoscale_view()
+        self.canvas.draw_idle()
     
     def set_units(self, disp_unit, force_unit):
         """设置单位
@@ -45,12 +198,11 @@ class HysteresisViz:
         参数:
             text: 要添加的文本
         """
-        self.result_text.insert("end", text)
-        self.result_text.see("end")
+        self.result_view.update_result(text)
     
     def clear_result(self):
         """清空结果文本"""
-        self.result_text.delete(1.0, "end")
+        self.result_view.clear_result()
     
     def draw_raw_hysteresis(self, displacement, force, disp_unit="mm", force_unit="kN"):
         """绘制原始滞回曲线
@@ -66,33 +218,36 @@ class HysteresisViz:
             self.current_disp_unit = disp_unit
             self.current_force_unit = force_unit
             
-            # 清空图形
-            self.fig.clear()
-            ax = self.fig.add_subplot(111)
-            
-            # 绘制滞回曲线
-            ax.plot(displacement, force, 'b-')
-            
-            # 设置标签和标题
-            ax.set_xlabel(f"位移 ({self.current_disp_unit})")
-            ax.set_ylabel(f"力 ({self.current_force_unit})")
-            ax.set_title("原始滞回曲线")
-            
-            # 添加网格和原点参考线
-            ax.grid(True, linestyle='--', alpha=0.7)
-            ax.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-            ax.axvline(x=0, color='k', linestyle='-', alpha=0.3)
-            
-            # 重新绘制
-            self.fig.tight_layout()
-            self.canvas.draw()
+            if self._layout == "raw":
+                # 复用已有曲线，只更新数据
+                self._lines["raw"].set_data(*_decimate(displacement, force))
+                self._update_axes()
+            else:
+                # 清空或复用单个坐标轴
+                ax = self._single_axes()
+                
+                # 绘制滞回曲线
+                self._lines["raw"], = ax.plot(*_decimate(displacement, force), 'b-')
+                
+                # 设置标签、标题、网格和原点参考线
+                self._setup_axes(ax, "原始滞回曲线")
+                self._ax = ax
+                self._layout = "raw"
+                
+                # 重新绘制
+                self.canvas.draw_idle()
             
             # 更新结果区域
+            disp = np.asarray(displacement)
+            force = np.asarray(force)
+            lines = [
+                "原始滞回曲线\n\n",
+                f"数据点数: {len(disp)}\n",
+                f"位移范围: [{disp.min():.3f} ~ {disp.max():.3f}] {self.current_disp_unit}\n",
+                f"力范围: [{force.min():.3f} ~ {force.max():.3f}] {self.current_force_unit}\n",
+            ]
             self.clear_result()
-            self.update_result("原始滞回曲线\n\n")
-            self.update_result(f"数据点数: {len(displacement)}\n")
-            self.update_result(f"位移范围: [{min(displacement):.3f} ~ {max(displacement):.3f}] {self.current_disp_unit}\n")
-            self.update_result(f"力范围: [{min(force):.3f} ~ {max(force):.3f}] {self.current_force_unit}\n")
+            self.update_result("".join(lines))
             
             return True
         
@@ -119,60 +274,82 @@ class HysteresisViz:
             self.current_disp_unit = disp_unit
             self.current_force_unit = force_unit
             
-            # 清空图形
-            self.fig.clear()
-            ax = self.fig.add_subplot(111)
-            
-            # 绘制处理后的滞回曲线
-            ax.plot(displacement, force, 'b-', alpha=0.5, label="完整数据")
-            
-            # 绘制峰谷值点
-            if peaks is not None and len(peaks) > 0:
-                ax.plot(displacement[peaks], force[peaks], 'ro', label="峰值点")
-            if valleys is not None and len(valleys) > 0:
-                ax.plot(displacement[valleys], force[valleys], 'go', label="谷值点")
+            has_peaks = peaks is not None and len(peaks) > 0
+            has_valleys = valleys is not None and len(valleys) > 0
+            peak_data = (displacement[peaks], force[peaks]) if has_peaks else ([], [])
+            valley_data = (displacement[valleys], force[valleys]) if has_valleys else ([], [])
+            
+            reuse = self._layout == "processed"
+            if reuse:
+                # 复用完整数据和峰谷值点曲线，只更新数据
+                ax = self._ax
+                self._lines["processed"].set_data(displacement, force)
+                self._lines["peaks"].set_data(*peak_data)
+                self._lines["valleys"].set_data(*valley_data)
+            else:
+                # 清空或复用单个坐标轴
+                ax = self._single_axes()
+                
+                # 绘制处理后的滞回曲线
+                self._lines["processed"], = ax.plot(displacement, force, 'b-', alpha=0.5, label="完整数据")
+                
+                # 绘制峰谷值点
+                self._lines["peaks"], = ax.plot(*peak_data, 'ro', label="峰值点")
+                self._lines["valleys"], = ax.plot(*valley_data, 'go', label="谷值点")
+                
+                # 所有循环曲线合并为一个LineCollection
+                self._lines["cycles"] = LineCollection([], linewidths=2)
+                ax.add_collection(self._lines["cycles"], autolim=False)
+                
+                # 设置标签、标题、网格和原点参考线
+                self._setup_axes(ax, "处理后滞回曲线及循环识别")
+                self._ax = ax
+                self._layout = "processed"
             
             # 绘制各个循环
-            colors = plt.cm.tab10.colors
-            for i, (start_idx, end_idx) in enumerate(cycles):
-                cycle_idx = i % len(colors)
-                cycle_disp = displacement[start_idx:end_idx]
-                cycle_force = force[start_idx:end_idx]
-                ax.plot(cycle_disp, cycle_force, '-', color=colors[cycle_idx], linewidth=2,
-                       label=f"循环 {i+1}")
-            
-            # 设置标签和标题
-            ax.set_xlabel(f"位移 ({self.current_disp_unit})")
-            ax.set_ylabel(f"力 ({self.current_force_unit})")
-            ax.set_title("处理后滞回曲线及循环识别")
-            
-            # 添加网格和原点参考线
-            ax.grid(True, linestyle='--', alpha=0.7)
-            ax.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-            ax.axvline(x=0, color='k', linestyle='-', alpha=0.3)
-            
-            # 添加图例
-            ax.legend(loc='upper left', bbox_to_anchor=(1.02, 1), borderaxespad=0)
+            cycle_colors = _cycle_colors(len(cycles))
+            self._lines["cycles"].set_segments([
+                np.column_stack((displacement[start_idx:end_idx], force[start_idx:end_idx]))
+                for start_idx, end_idx in cycles
+            ])
+            self._lines["cycles"].set_color(cycle_colors)
+            
+            # 添加图例，不显示没有数据的峰谷值点，循环曲线用代理图例项
+            handles = [self._lines["processed"]]
+            if has_peaks:
+                handles.append(self._lines["peaks"])
+            if has_valleys:
+                handles.append(self._lines["valleys"])
+            handles.extend(Line2D([], [], color=color, linewidth=2, label=f"循环 {i+1}")
+                           for i, color in enumerate(cycle_colors))
+            ax.legend(handles=handles, loc='upper left', bbox_to_anchor=(1.02, 1), borderaxespad=0)
             
             # 重新绘制
-            self.fig.tight_layout()
-            self.canvas.draw()
+            if reuse:
+                self._update_axes()
+            else:
+                self.canvas.draw_idle()
             
             # 更新结果区域
-            self.clear_result()
-            self.update_result("处理后滞回曲线及循环识别\n\n")
-            self.update_result(f"数据点数: {len(displacement)}\n")
-            self.update_result(f"识别循环数: {len(cycles)}\n")
-            self.update_result(f"峰值点数: {len(peaks) if peaks is not None else 0}\n")
-            self.update_result(f"谷值点数: {len(valleys) if valleys is not None else 0}\n\n")
+            lines = [
+                "处理后滞回曲线及循环识别\n\n",
+                f"数据点数: {len(displacement)}\n",
+                f"识别循环数: {len(cycles)}\n",
+                f"峰值点数: {len(peaks) if peaks is not None else 0}\n",
+                f"谷值点数: {len(valleys) if valleys is not None else 0}\n\n",
+            ]
+            
+            # 各循环的统计量一次算出，报告时不再切片访问原始数据
+            lengths, ((disp_mins, disp_maxs), (force_mins, force_maxs)) = _cycle_ranges(
+                cycles, displacement, force)
+            for i in range(len(lengths)):
+                lines.append(f"循环 {i+1}:\n")
+                lines.append(f"  点数: {lengths[i]}\n")
+                lines.append(f"  位移范围: [{disp_mins[i]:.3f} ~ {disp_maxs[i]:.3f}] {self.current_disp_unit}\n")
+                lines.append(f"  力范围: [{force_mins[i]:.3f} ~ {force_maxs[i]:.3f}] {self.current_force_unit}\n\n")
             
-            for i, (start_idx, end_idx) in enumerate(cycles):
-                cycle_disp = displacement[start_idx:end_idx]
-                cycle_force = force[start_idx:end_idx]
-                self.update_result(f"循环 {i+1}:\n")
-                self.update_result(f"  点数: {len(cycle_disp)}\n")
-                self.update_result(f"  位移范围: [{min(cycle_disp):.3f} ~ {max(cycle_disp):.3f}] {self.current_disp_unit}\n")
-                self.update_result(f"  力范围: [{min(cycle_force):.3f} ~ {max(cycle_force):.3f}] {self.current_force_unit}\n\n")
+            self.clear_result()
+            self.update_result("".join(lines))
             
             return True
         
@@ -195,39 +372,27 @@ class HysteresisViz:
             self.current_disp_unit = disp_unit
             self.current_force_unit = force_unit
             
-            # 清空结果区域
-            self.clear_result()
-            self.update_result("等效刚度计算结果\n\n")
+            # 先组装全部文本，最后一次写入结果区域
+            lines = ["等效刚度计算结果\n\n"]
             
             # 显示每个循环的等效刚度
-            self.update_result(f"{'循环':<6}{'位移范围 ('+disp_unit+')':<20}{'力范围 ('+force_unit+')':<20}{'等效刚度 ('+force_unit+'/'+disp_unit+')':<20}{'能量耗散':<15}\n")
-            self.update_result("-" * 80 + "\n")
-            
-            # 计算平均刚度
-            total_stiffness = 0
-            valid_cycle_count = 0
+            lines.append(f"{'循环':<6}{'位移范围 ('+disp_unit+')':<20}{'力范围 ('+force_unit+')':<20}{'等效刚度 ('+force_unit+'/'+disp_unit+')':<20}{'能量耗散':<15}\n")
+            lines.append("-" * 80 + "\n")
             
             for cycle_idx, result in results.items():
-                stiffness = result["stiffness"]
-                energy = result["energy_dissipation"]
-                max_disp = result["max_disp"]
-                min_disp = result["min_disp"]
-                max_force = result["max_force"]
-                min_force = result["min_force"]
-                disp_range = max_disp - min_disp
-                force_range = max_force - min_force
-                
-                self.update_result(f"{cycle_idx+1:<6}{min_disp:.3f} ~ {max_disp:.3f}  {min_force:.3f} ~ {max_force:.3f}  {stiffness:.3f}  {energy:.3f}\n")
-                
-                total_stiffness += stiffness
-                valid_cycle_count += 1
+                lines.append(f"{cycle_idx+1:<6}{result['min_disp']:.3f} ~ {result['max_disp']:.3f}  "
+                             f"{result['min_force']:.3f} ~ {result['max_force']:.3f}  "
+                             f"{result['stiffness']:.3f}  {result['energy_dissipation']:.3f}\n")
             
             # 显示平均刚度
-            if valid_cycle_count > 0:
-                avg_stiffness = total_stiffness / valid_cycle_count
-                self.update_result("-" * 80 + "\n")
-                self.update_result(f"平均等效刚度: {avg_stiffness:.3f} {force_unit}/{disp_unit}\n")
+            if results:
+                stiffness = np.fromiter((r["stiffness"] for r in results.values()),
+                                        dtype=np.float64, count=len(results))
+                lines.append("-" * 80 + "\n")
+                lines.append(f"平均等效刚度: {stiffness.mean():.3f} {force_unit}/{disp_unit}\n")
             
+            self.clear_result()
+            self.update_result("".join(lines))
             return True
         
         except Exception as e:
@@ -253,28 +418,32 @@ class HysteresisViz:
             self.current_force_unit = force_unit
             
             # 清空图形
-            self.fig.clear()
+            self._clear_figure()
             
             # 创建两个子图
             ax1 = self.fig.add_subplot(211)  # 上半部分 - 循环和刚度线
+            # 添加曲线期间暂停自动缩放，全部添加后统一计算坐标范围
+            ax1.set_autoscale_on(False)
             ax2 = self.fig.add_subplot(212)  # 下半部分 - 刚度变化
             
             # 绘制循环和刚度线
-            colors = plt.cm.tab10.colors
+            colors = _cycle_colors(len(cycles))
             
             # 首先绘制完整数据的轮廓
-            ax1.plot(displacement, force, 'k-', alpha=0.2)
+            ax1.plot(*_decimate(displacement, force), 'k-', alpha=0.2)
             
             # 计算平均刚度
             total_stiffness = 0
             stiffness_values = []
             cycle_indices = []
+            _, ((disp_mins, disp_maxs),) = _cycle_ranges(cycles, displacement)
+            
+            # 循环曲线和等效刚度线各合并为一个LineCollection
+            cycle_segments = []
+            stiffness_segments = []
+            segment_cycles = []
             
             for i, (start_idx, end_idx) in enumerate(cycles):
-                cycle_idx = i % len(colors)
-                cycle_disp = displacement[start_idx:end_idx]
-                cycle_force = force[start_idx:end_idx]
-                
                 # 获取该循环的等效刚度
                 if i in stiffness_results:
                     stiffness = stiffness_results[i]["stiffness"]
@@ -282,22 +451,29 @@ class HysteresisViz:
                     stiffness_values.append(stiffness)
                     cycle_indices.append(i+1)
                     
-                    # 绘制循环曲线
-                    ax1.plot(cycle_disp, cycle_force, '-', color=colors[cycle_idx], linewidth=2, 
-                           label=f"循环 {i+1}")
+                    # 循环曲线
+                    cycle_segments.append(np.column_stack((displacement[start_idx:end_idx],
+                                                           force[start_idx:end_idx])))
+                    segment_cycles.append(i)
                     
-                    # 计算并绘制等效刚度线
-                    min_disp = min(cycle_disp)
-                    max_disp = max(cycle_disp)
+                    # 计算等效刚度线
+                    min_disp = disp_mins[i]
+                    max_disp = disp_maxs[i]
                     mid_disp = (min_disp + max_disp) / 2
                     
                     # 使用等效刚度计算力值
                     min_force_fitted = stiffness * (min_disp - mid_disp)
                     max_force_fitted = stiffness * (max_disp - mid_disp)
-                    
-                    # 绘制等效刚度线
-                    ax1.plot([min_disp, max_disp], [min_force_fitted, max_force_fitted], '--', 
-                           color=colors[cycle_idx], linewidth=1)
+                    stiffness_segments.append([(min_disp, min_force_fitted), (max_disp, max_force_fitted)])
+            
+            # 绘制循环曲线和等效刚度线
+            segment_colors = colors[segment_cycles]
+            ax1.add_collection(LineCollection(cycle_segments, colors=segment_colors, linewidths=2))
+            ax1.add_collection(LineCollection(stiffness_segments, colors=segment_colors,
+                                              linewidths=1, linestyles='--'))
+            
+            # 统一计算坐标范围，数据范围已在添加曲线时累计
+            ax1.autoscale()
             
             # 设置标签和标题
             ax1.set_xlabel(f"位移 ({self.current_disp_unit})")
@@ -333,8 +509,7 @@ class HysteresisViz:
                 ax2.legend(loc='best')
             
             # 重新绘制
-            self.fig.tight_layout()
-            self.canvas.draw()
+            self.canvas.draw_idle()
             
             return True
         
@@ -347,7 +522,7 @@ class HysteresisViz:
         
         参数:
             workcases: 工况数据列表
-            skeleton_data: 骨架曲线数据
+            skeleton_data: 骨架曲线数据，(位移数组, 力数组)
             disp_unit: 位移单位
             force_unit: 力单位
         """
@@ -356,69 +531,83 @@ class HysteresisViz:
             self.current_disp_unit = disp_unit
             self.current_force_unit = force_unit
             
-            # 清空图形
-            self.fig.clear()
-            ax = self.fig.add_subplot(111)
-            
-            # 绘制各个工况的滞回曲线
-            colors = plt.cm.tab10.colors
-            
-            for i, workcase in enumerate(workcases):
-                cycle_idx = i % len(colors)
-                cycle_disp = workcase["displacement"]
-                cycle_force = workcase["force"]
-                workcase_name = workcase["name"]
+            names = [workcase["name"] for workcase in workcases]
+            skeleton_disp, skeleton_force = _skeleton_arrays(skeleton_data)
+            
+            # 工况相同时复用已有曲线，只更新数据
+            reuse = self._layout == "skeleton" and self._skeleton_names == names
+            if reuse:
+                ax = self._ax
+                for (curve, max_marker, min_marker), workcase in zip(self._cycle_lines, workcases):
+                    cycle_disp = workcase["displacement"]
+                    cycle_force = workcase["force"]
+                    min_disp_idx, max_disp_idx = ud.argminmax(cycle_disp)
+                    curve.set_data(cycle_disp, cycle_force)
+                    max_marker.set_data([cycle_disp[max_disp_idx]], [cycle_force[max_disp_idx]])
+                    min_marker.set_data([cycle_disp[min_disp_idx]], [cycle_force[min_disp_idx]])
+                self._lines["skeleton"].set_data(skeleton_disp, skeleton_force)
+            else:
+                # 清空或复用单个坐标轴
+                ax = self._single_axes()
                 
-                ax.plot(cycle_disp, cycle_force, '-', color=colors[cycle_idx], alpha=0.5,
-                       label=f"{workcase_name}")
+                # 绘制各个工况的滞回曲线
+                colors = _cycle_colors(len(workcases))
                 
-                # 标记峰值点
-                max_disp_idx = np.argmax(cycle_disp)
-                min_disp_idx = np.argmin(cycle_disp)
+                for i, workcase in enumerate(workcases):
+                    cycle_disp = workcase["displacement"]
+                    cycle_force = workcase["force"]
+                    workcase_name = workcase["name"]
+                    
+                    curve, = ax.plot(cycle_disp, cycle_force, '-', color=colors[i], alpha=0.5,
+                                     label=f"{workcase_name}")
+                    
+                    # 标记峰值点
+                    min_disp_idx, max_disp_idx = ud.argminmax(cycle_disp)
+                    
+                    max_marker, = ax.plot(cycle_disp[max_disp_idx], cycle_force[max_disp_idx], 'o', 
+                                          color=colors[i], markersize=8)
+                    min_marker, = ax.plot(cycle_disp[min_disp_idx], cycle_force[min_disp_idx], 's', 
+                                          color=colors[i], markersize=8)
+                    self._cycle_lines.append((curve, max_marker, min_marker))
                 
-                ax.plot(cycle_disp[max_disp_idx], cycle_force[max_disp_idx], 'o', 
-                       color=colors[cycle_idx], markersize=8)
-                ax.plot(cycle_disp[min_disp_idx], cycle_force[min_disp_idx], 's', 
-                       color=colors[cycle_idx], markersize=8)
-            
-            # 绘制骨架曲线
-            if skeleton_data:
-                skeleton_disp = [p[0] for p in skeleton_data]
-                skeleton_force = [p[1] for p in skeleton_data]
+                # 绘制骨架曲线，没有数据时保留空曲线以便之后更新
+                self._lines["skeleton"], = ax.plot(skeleton_disp, skeleton_force, 'k--', linewidth=2,
+                                                   label="骨架曲线")
                 
-                ax.plot(skeleton_disp, skeleton_force, 'k--', linewidth=2, label="骨架曲线")
-            
-            # 设置标签和标题
-            ax.set_xlabel(f"位移 ({self.current_disp_unit})")
-            ax.set_ylabel(f"力 ({self.current_force_unit})")
-            ax.set_title("骨架曲线")
-            
-            # 添加网格和原点参考线
-            ax.grid(True, linestyle='--', alpha=0.7)
-            ax.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-            ax.axvline(x=0, color='k', linestyle='-', alpha=0.3)
-            
-            # 添加图例
+                # 设置标签、标题、网格和原点参考线
+                self._setup_axes(ax, "骨架曲线")
+                self._ax = ax
+                self._layout = "skeleton"
+                self._skeleton_names = names
+            
+            # 图例中不显示没有数据的骨架曲线
+            self._lines["skeleton"].set_label("骨架曲线" if len(skeleton_disp) else "_nolegend_")
             ax.legend(loc='best')
             
             # 重新绘制
-            self.fig.tight_layout()
-            self.canvas.draw()
+            if reuse:
+                self._update_axes()
+            else:
+                self.canvas.draw_idle()
             
             # 更新结果区域
-            self.clear_result()
-            self.update_result("骨架曲线\n\n")
-            self.update_result(f"工况数量: {len(workcases)}\n")
-            self.update_result(f"骨架曲线点数: {len(skeleton_data)}\n\n")
+            lines = [
+                "骨架曲线\n\n",
+                f"工况数量: {len(workcases)}\n",
+                f"骨架曲线点数: {len(skeleton_disp)}\n\n",
+            ]
             
             for i, workcase in enumerate(workcases):
                 workcase_name = workcase["name"]
                 stiffness = workcase.get("stiffness", 0)
                 energy = workcase.get("energy", 0)
                 
-                self.update_result(f"工况 {i+1}: {workcase_name}\n")
-                self.update_result(f"  等效刚度: {stiffness:.3f} {force_unit}/{disp_unit}\n")
-                self.update_result(f"  能量耗散: {energy:.3f}\n\n")
+                lines.append(f"工况 {i+1}: {workcase_name}\n")
+                lines.append(f"  等效刚度: {stiffness:.3f} {force_unit}/{disp_unit}\n")
+                lines.append(f"  能量耗散: {energy:.3f}\n\n")
+            
+            self.clear_result()
+            self.update_result("".join(lines))
             
             return True
         
@@ -433,7 +622,7 @@ class HysteresisViz:
         
         参数:
             workcases: 工况数据列表
-            skeleton_data: 骨架曲线数据
+            skeleton_data: 骨架曲线数据，(位移数组, 力数组)
             disp_unit: 位移单位
             force_unit: 力单位
         """
@@ -443,19 +632,20 @@ class HysteresisViz:
             self.current_force_unit = force_unit
             
             # 清空图形
-            self.fig.clear()
+            self._clear_figure()
             
             # 创建两个子图
             ax1 = self.fig.add_subplot(211)  # 上半部分 - 滞回曲线和骨架曲线
+            # 添加曲线期间暂停自动缩放，全部添加后统一计算坐标范围
+            ax1.set_autoscale_on(False)
             ax2 = self.fig.add_subplot(212)  # 下半部分 - 刚度对比
             
             # 绘制各个工况的滞回曲线和骨架曲线
-            colors = plt.cm.tab10.colors
+            colors = _cycle_colors(len(workcases))
             stiffness_values = []
             workcase_names = []
             
             for i, workcase in enumerate(workcases):
-                cycle_idx = i % len(colors)
                 cycle_disp = workcase["displacement"]
                 cycle_force = workcase["force"]
                 workcase_name = workcase["name"]
@@ -466,25 +656,25 @@ class HysteresisViz:
                 workcase_names.append(workcase_name)
                 
                 # 绘制滞回曲线
-                ax1.plot(cycle_disp, cycle_force, '-', color=colors[cycle_idx], alpha=0.5,
+                ax1.plot(cycle_disp, cycle_force, '-', color=colors[i], alpha=0.5,
                         label=f"{workcase_name}")
                 
                 # 标记峰值点
-                max_disp_idx = np.argmax(cycle_disp)
-                min_disp_idx = np.argmin(cycle_disp)
+                min_disp_idx, max_disp_idx = ud.argminmax(cycle_disp)
                 
                 ax1.plot(cycle_disp[max_disp_idx], cycle_force[max_disp_idx], 'o', 
-                        color=colors[cycle_idx], markersize=8)
+                        color=colors[i], markersize=8)
                 ax1.plot(cycle_disp[min_disp_idx], cycle_force[min_disp_idx], 's', 
-                        color=colors[cycle_idx], markersize=8)
+                        color=colors[i], markersize=8)
             
             # 绘制骨架曲线
-            if skeleton_data:
-                skeleton_disp = [p[0] for p in skeleton_data]
-                skeleton_force = [p[1] for p in skeleton_data]
-                
+            skeleton_disp, skeleton_force = _skeleton_arrays(skeleton_data)
+            if len(skeleton_disp):
                 ax1.plot(skeleton_disp, skeleton_force, 'k--', linewidth=2, label="骨架曲线")
             
+            # 统一计算坐标范围，数据范围已在添加曲线时累计
+            ax1.autoscale()
+            
             # 设置标签和标题
             ax1.set_xlabel(f"位移 ({self.current_disp_unit})")
             ax1.set_ylabel(f"力 ({self.current_force_unit})")
@@ -500,11 +690,8 @@ class HysteresisViz:
             
             # 绘制刚度对比条形图
             bar_positions = list(range(len(stiffness_values)))
-            bars = ax2.bar(bar_positions, stiffness_values, align='center', alpha=0.7)
-            
-            # 设置颜色与上图一致
-            for i, bar in enumerate(bars):
-                bar.set_color(colors[i % len(colors)])
+            # 颜色与上图一致
+            ax2.bar(bar_positions, stiffness_values, align='center', alpha=0.7, color=colors)
             
             # 设置刻度标签
             ax2.set_xticks(bar_positions)
@@ -522,17 +709,16 @@ class HysteresisViz:
             ax2.grid(True, linestyle='--', alpha=0.7, axis='y')
             
             # 重新绘制
-            self.fig.tight_layout()
-            self.canvas.draw()
+            self.canvas.draw_idle()
             
             # 更新结果区域
-            self.clear_result()
-            self.update_result("多工况骨架曲线\n\n")
-            self.update_result(f"工况数量: {len(workcases)}\n")
-            self.update_result(f"骨架曲线点数: {len(skeleton_data)}\n\n")
-            
-            self.update_result(f"{'工况':<6}{'名称':<20}{'位移范围 ('+disp_unit+')':<20}{'等效刚度 ('+force_unit+'/'+disp_unit+')':<20}\n")
-            self.update_result("-" * 70 + "\n")
+            lines = [
+                "多工况骨架曲线\n\n",
+                f"工况数量: {len(workcases)}\n",
+                f"骨架曲线点数: {len(skeleton_disp)}\n\n",
+                f"{'工况':<6}{'名称':<20}{'位移范围 ('+disp_unit+')':<20}{'等效刚度 ('+force_unit+'/'+disp_unit+')':<20}\n",
+                "-" * 70 + "\n",
+            ]
             
             for i, workcase in enumerate(workcases):
                 workcase_name = workcase["name"]
@@ -540,8 +726,10 @@ class HysteresisViz:
                 max_disp = workcase.get("max_disp", 0)
                 min_disp = workcase.get("min_disp", 0)
                 
-                self.update_result(f"{i+1:<6}{workcase_name:<20}{min_disp:.3f} ~ {max_disp:.3f}  {stiffness:.3f}\n")
+                lines.append(f"{i+1:<6}{workcase_name:<20}{min_disp:.3f} ~ {max_disp:.3f}  {stiffness:.3f}\n")
             
+            self.clear_result()
+            self.update_result("".join(lines))
             return True
         
         except Exception as e:
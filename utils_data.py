@@ -19,6 +19,340 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    # 未安装numba时，被装饰的函数按普通Python函数执行
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# 循环特征点表的字段，缺失的峰值点为NaN
+CYCLE_TABLE_DTYPE = np.dtype([
+    ('cycle', np.int32),
+    ('pos_disp', np.float64),
+    ('pos_force', np.float64),
+    ('neg_disp', np.float64),
+    ('neg_force', np.float64),
+    ('anomaly', np.bool_),
+    ('start', np.intp),  # 循环在处理后数组中的起止位置 [start, end)
+    ('end', np.intp),
+])
+
+# python-calamine可直接解析的表格格式
+CALAMINE_EXTENSIONS = ('.xlsx', '.xlsm', '.xlsb', '.xls', '.ods')
+
+def _read_with_calamine(file_path, skiprows=0):
+    """使用python-calamine直接读取Excel文件的第一个工作表
+
+    参数:
+        file_path (str): 文件路径
+        skiprows (int): 跳过数据前几行（不包括标题行）
+
+    返回:
+        DataFrame: 读取的数据
+    """
+    from python_calamine import CalamineWorkbook
+
+    rows = CalamineWorkbook.from_path(file_path).get_sheet_by_index(0).to_python(skip_empty_area=False)
+    if not rows:
+        return pd.DataFrame()
+
+    # 空标题与pandas保持一致命名为 "Unnamed: i"
+    header = [v if v not in ("", None) else f"Unnamed: {i}" for i, v in enumerate(rows[0])]
+    data = pd.DataFrame(rows[1 + skiprows:], columns=header)
+
+    # calamine以空字符串表示空单元格，转换为NaN并恢复数值类型
+    return data.replace("", np.nan).infer_objects()
+
+def _read_with_openpyxl(file_path, skiprows=0):
+    """使用openpyxl只读模式逐行读取Excel文件的第一个工作表
+
+    只读模式不加载样式，data_only只取公式的缓存值而不保留公式本身
+
+    参数:
+        file_path (str): 文件路径
+        skiprows (int): 跳过数据前几行（不包括标题行）
+
+    返回:
+        DataFrame: 读取的数据
+    """
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        header_row = next(sheet.iter_rows(min_row=1, max_row=1, values_only=True), None)
+        if header_row is None:
+            return pd.DataFrame()
+        rows = list(sheet.iter_rows(min_row=skiprows + 2, values_only=True))
+    finally:
+        workbook.close()
+
+    # 与pandas一致，去掉末尾的空行
+    while rows and all(v is None for v in rows[-1]):
+        rows.pop()
+
+    header = [v if v is not None else f"Unnamed: {i}" for i, v in enumerate(header_row)]
+    return pd.DataFrame(rows, columns=header).infer_objects()
+
+def read_excel_data(file_path, skiprows=0, engine=None, fast_mode=True):
+    """读取Excel数据文件
+
+    第一行作为标题行，skiprows为标题行之后需要跳过的数据行数
+
+    参数:
+        file_path (str): 文件路径
+        skiprows (int): 跳过数据前几行（不包括标题行）
+        engine (str): pandas读取引擎，如"calamine"；不可用时回退到默认引擎
+        fast_mode (bool): 未指定引擎时，xlsx文件使用openpyxl只读模式直接读取
+            （只取公式的缓存值，不读取样式）
+
+    返回:
+        tuple: (data, error_message)
+    """
+    try:
+        if not os.path.exists(file_path):
+            return None, f"文件不存在: {file_path}"
+
+        # 保留标题行，只跳过其后的数据行
+        skip = range(1, skiprows + 1) if skiprows > 0 else None
+
+        ext = os.path.splitext(file_path)[1].lower()
+        if engine == "calamine" and ext in CALAMINE_EXTENSIONS:
+            # 直接使用calamine解析，跳过pandas的引擎封装
+            try:
+                return _read_with_calamine(file_path, skiprows), None
+            except ImportError as e:
+                logger.warning(f"calamine引擎读取失败，改用默认引擎: {str(e)}")
+        elif engine is not None:
+            try:
+                return pd.read_excel(file_path, skiprows=skip, engine=engine), None
+            except (ImportError, ValueError) as e:
+                logger.warning(f"{engine}引擎读取失败，改用默认引擎: {str(e)}")
+        elif fast_mode and ext in ('.xlsx', '.xlsm'):
+            return _read_with_openpyxl(file_path, skiprows), None
+
+        data = pd.read_excel(file_path, skiprows=skip)
+
+        return data, None
+    except Exception as e:
+        return None, f"读取Excel文件出错: {str(e)}"
+
+def _fill_columns(rows, indices, capacity):
+    """将逐行数据中指定列的数值写入预分配的数组
+
+    参数:
+        rows: 行迭代器，每行为单元格值的序列
+        indices (list): 需要读取的列序号
+        capacity (int): 预分配的行数，不足时按需倍增
+
+    返回:
+        tuple: (buffers, count)，count为实际读取的行数
+    """
+    capacity = max(capacity, 1)
+    buffers = [np.empty(capacity, dtype=np.float64) for _ in indices]
+    count = 0
+    for row in rows:
+        if count == capacity:
+            capacity *= 2
+            buffers = [np.resize(buf, capacity) for buf in buffers]
+        for buf, idx in zip(buffers, indices):
+            value = row[idx] if idx < len(row) else None
+            try:
+                buf[count] = np.nan if value is None or value == "" else float(value)
+            except (TypeError, ValueError):
+                buf[count] = np.nan
+        count += 1
+    return buffers, count
+
+def read_excel_header(file_path, engine=None):
+    """只读取Excel数据文件的标题行
+
+    参数:
+        file_path (str): 文件路径
+        engine (str): 读取引擎，目前支持"calamine"
+
+    返回:
+        tuple: (header, error_message)，空标题命名为 "Unnamed: i"
+    """
+    try:
+        if not os.path.exists(file_path):
+            return [], f"文件不存在: {file_path}"
+
+        ext = os.path.splitext(file_path)[1].lower()
+        header_row = None
+
+        if engine == "calamine" and ext in CALAMINE_EXTENSIONS:
+            try:
+                from python_calamine import CalamineWorkbook
+                sheet = CalamineWorkbook.from_path(file_path).get_sheet_by_index(0)
+                header_row = next(iter(sheet.iter_rows()), ())
+            except ImportError as e:
+                logger.warning(f"calamine引擎读取失败，改用openpyxl: {str(e)}")
+
+        if header_row is None and ext in ('.xlsx', '.xlsm'):
+            import openpyxl
+            workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+            try:
+                header_row = next(workbook.worksheets[0].iter_rows(min_row=1, max_row=1, values_only=True), ())
+            finally:
+                workbook.close()
+
+        if header_row is None:
+            return list(pd.read_excel(file_path, nrows=0).columns), None
+
+        return [v if v not in ("", None) else f"Unnamed: {i}" for i, v in enumerate(header_row)], None
+    except Exception as e:
+        return [], f"读取Excel文件出错: {str(e)}"
+
+def read_excel_columns(file_path, columns, skiprows=0, engine=None):
+    """只读取Excel数据文件中的指定列
+
+    engine为"calamine"且python-calamine可用时使用calamine解析；xlsx文件使用openpyxl
+    只读模式逐行读取；两者都只将所需列的数值写入预分配的数组。其他格式回退到pandas按列读取
+
+    参数:
+        file_path (str): 文件路径
+        columns (list): 需要读取的列名
+        skiprows (int): 跳过数据前几行（不包括标题行）
+        engine (str): 读取引擎，目前支持"calamine"
+
+    返回:
+        tuple: (data, header, error_message)，header为文件中的全部列名
+    """
+    try:
+        if not os.path.exists(file_path):
+            return None, [], f"文件不存在: {file_path}"
+
+        columns = list(dict.fromkeys(columns))
+        ext = os.path.splitext(file_path)[1].lower()
+
+        if engine == "calamine" and ext in CALAMINE_EXTENSIONS:
+            try:
+                from python_calamine import CalamineWorkbook
+                rows = CalamineWorkbook.from_path(file_path).get_sheet_by_index(0).to_python(skip_empty_area=False)
+                header_row = rows[0] if rows else ()
+                body = rows[1 + skiprows:]
+            except ImportError as e:
+                logger.warning(f"calamine引擎读取失败，改用openpyxl: {str(e)}")
+            else:
+                header = [v if v not in ("", None) else f"Unnamed: {i}" for i, v in enumerate(header_row)]
+                missing = [c for c in columns if c not in header]
+                if missing:
+                    return None, header, f"文件中不存在通道: {', '.join(map(str, missing))}"
+                indices = [header.index(c) for c in columns]
+                buffers, count = _fill_columns(body, indices, len(body))
+                data = pd.DataFrame({col: buf[:count] for col, buf in zip(columns, buffers)})
+                return data.dropna(how='all').reset_index(drop=True), header, None
+
+        if ext not in ('.xlsx', '.xlsm'):
+            header = list(pd.read_excel(file_path, nrows=0).columns)
+            missing = [c for c in columns if c not in header]
+            if missing:
+                return None, header, f"文件中不存在通道: {', '.join(map(str, missing))}"
+            skip = range(1, skiprows + 1) if skiprows > 0 else None
+            data = pd.read_excel(file_path, skiprows=skip, usecols=columns)
+            return data, header, None
+
+        import openpyxl
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            sheet = workbook.worksheets[0]
+
+            # 读取标题行，空标题与pandas保持一致命名为 "Unnamed: i"
+            header_row = next(sheet.iter_rows(min_row=1, max_row=1, values_only=True), ())
+            header = [v if v is not None else f"Unnamed: {i}" for i, v in enumerate(header_row)]
+
+            missing = [c for c in columns if c not in header]
+            if missing:
+                return None, header, f"文件中不存在通道: {', '.join(map(str, missing))}"
+            indices = [header.index(c) for c in columns]
+
+            # 按工作表行数预分配数组，行数未知时按需倍增
+            capacity = max((sheet.max_row or 0) - skiprows - 1, 0) or 1024
+            buffers, count = _fill_columns(
+                sheet.iter_rows(min_row=skiprows + 2, values_only=True), indices, capacity
+            )
+        finally:
+            workbook.close()
+
+        data = pd.DataFrame({col: buf[:count] for col, buf in zip(columns, buffers)})
+        # 与pandas一致，去掉所选列全为空的行
+        data = data.dropna(how='all').reset_index(drop=True)
+
+        return data, header, None
+    except Exception as e:
+        return None, [], f"读取Excel文件出错: {str(e)}"
+
+def extract_channel_data(data, disp_channel, force1_channel, force2_channel=None, dtype=np.float64):
+    """从数据表中提取位移和力通道
+
+    列本身已是所需类型时直接返回其数组视图而不复制；指定两个力通道时，
+    两者之和写入一个新分配的数组
+
+    参数:
+        data (DataFrame): 数据表
+        disp_channel (str): 位移通道名称
+        force1_channel (str): 力通道1名称
+        force2_channel (str): 力通道2名称(可选)
+        dtype: 返回数组的浮点类型
+
+    返回:
+        tuple: (displacement, force, error_message)
+    """
+    try:
+        displacement = data[disp_channel].to_numpy(dtype=dtype, copy=False)
+        force = data[force1_channel].to_numpy(dtype=dtype, copy=False)
+
+        if force2_channel:
+            force2 = data[force2_channel].to_numpy(dtype=dtype, copy=False)
+            force = np.add(force, force2, out=np.empty_like(force))
+
+        return displacement, force, None
+    except KeyError as e:
+        return None, None, f"数据中不存在通道: {str(e)}"
+    except Exception as e:
+        return None, None, f"提取通道数据出错: {str(e)}"
+
+def preprocess_data(displacement, force, dtype=np.float32, window_length=11, polyorder=3):
+    """预处理位移和力数据：去除无效值并进行Savitzky-Golay平滑
+
+    默认以float32计算，内存读写量减半；需要更高精度时传入dtype=np.float64
+
+    参数:
+        displacement (ndarray): 位移数据
+        force (ndarray): 力数据
+        dtype: 计算使用的浮点类型
+        window_length (int): 平滑窗口长度
+        polyorder (int): 平滑多项式阶数
+
+    返回:
+        tuple: (displacement, force, error_message)
+    """
+    try:
+        displacement = np.ascontiguousarray(displacement, dtype=dtype)
+        force = np.ascontiguousarray(force, dtype=dtype)
+
+        # 去除NaN和无穷大值
+        valid = np.isfinite(displacement) & np.isfinite(force)
+        if not valid.all():
+            displacement = displacement[valid]
+            force = force[valid]
+
+        # 数据点足够时进行平滑
+        if len(displacement) > window_length:
+            displacement = savgol_filter(displacement, window_length, polyorder).astype(dtype, copy=False)
+            force = savgol_filter(force, window_length, polyorder).astype(dtype, copy=False)
+
+        return displacement, force, None
+    except Exception as e:
+        return displacement, force, f"数据预处理出错: {str(e)}"
+
 def calculate_stiffness(displacement, force):
     """计算等效刚度
     
@@ -75,6 +409,36 @@ def calculate_stiffness(displacement, force):
         traceback.print_exc()
         return 0, f"刚度计算错误: {str(e)}"
 
+def calculate_cycle_energy_batch(cycles):
+    """一次计算所有循环的耗能（滞回环所围面积）
+
+    将各循环首尾相接拼为一个数组，用鞋带公式计算叉积后按循环分段求和，
+    每个循环视为闭合多边形
+
+    参数:
+        cycles (dict): 循环数据字典 {循环编号: (位移数组, 力数组)}
+
+    返回:
+        tuple: (cycle_nums, energy)，均为按循环编号排序的数组
+    """
+    cycle_nums = np.array([n for n in sorted(cycles) if len(cycles[n][0]) > 0], dtype=np.int32)
+    if cycle_nums.size == 0:
+        return cycle_nums, np.empty(0, dtype=np.float64)
+
+    disp = np.concatenate([np.asarray(cycles[n][0], dtype=np.float64) for n in cycle_nums])
+    force = np.concatenate([np.asarray(cycles[n][1], dtype=np.float64) for n in cycle_nums])
+    lengths = np.array([len(cycles[n][0]) for n in cycle_nums])
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+
+    # 每个点的下一个点，循环的最后一点回到该循环的起点
+    nxt = np.arange(1, len(disp) + 1)
+    nxt[ends - 1] = starts
+
+    cross = disp * force[nxt] - disp[nxt] * force
+    energy = 0.5 * np.abs(np.add.reduceat(cross, starts))
+    return cycle_nums, energy
+
 def calculate_equivalent_stiffness(cycles, cycle_features):
     """计算等效刚度
     
@@ -86,87 +450,65 @@ def calculate_equivalent_stiffness(cycles, cycle_features):
         tuple: (cycle_stiffness_dict, avg_stiffness, cumulative_stiffness, error_message)
     """
     try:
-        cycle_stiffness = {}
-        cycle_stiffness_values = []
+        cycle_nums = list(cycles.keys())
+        n = len(cycle_nums)
         
-        for cycle_num, (cycle_disp, cycle_force) in cycles.items():
+        # 每个循环的 [最大位移, 最小位移, 最大位移对应力, 最小位移对应力]
+        points = np.zeros((n, 4))
+        anomaly = np.zeros(n, dtype=bool)
+        has_peaks = np.zeros(n, dtype=bool)
+        
+        for i, (cycle_num, (cycle_disp, cycle_force)) in enumerate(cycles.items()):
             # 获取特征点信息
             features = cycle_features.get(cycle_num, {})
-            anomaly = features.get('anomaly', False)
+            anomaly[i] = features.get('anomaly', False)
+            pos_peak = features.get('positive_peak')
+            neg_peak = features.get('negative_peak')
             
-            # 记录刚度信息
-            if cycle_num not in cycle_stiffness:
-                cycle_stiffness[cycle_num] = {}
-                
-            # 使用正向峰值点和负向峰值点计算等效刚度
-            if 'positive_peak' in features and features['positive_peak'] is not None and \
-               'negative_peak' in features and features['negative_peak'] is not None:
-                # 提取正向峰值点和负向峰值点
-                pos_peak = features['positive_peak']  # (disp, force)
-                neg_peak = features['negative_peak']  # (disp, force)
-                
-                # 计算等效刚度 (F_max - F_min) / (Disp_max - Disp_min)
-                disp_diff = pos_peak[0] - neg_peak[0]
-                force_diff = pos_peak[1] - neg_peak[1]
-                
-                if abs(disp_diff) > 1e-10:  # 避免除以接近零的数
-                    peak_stiffness = force_diff / disp_diff
-                else:
-                    peak_stiffness = 0
-                    
-                # 保存峰值点计算的等效刚度结果
-                cycle_stiffness[cycle_num] = {
-                    'equivalent': peak_stiffness,
-                    'max_disp': pos_peak[0],
-                    'min_disp': neg_peak[0],
-                    'max_disp_force': pos_peak[1],
-                    'min_disp_force': neg_peak[1],
-                    'anomaly': anomaly
-                }
-                
-                # 只有非异常值才计入平均
-                if not anomaly and peak_stiffness != 0:
-                    cycle_stiffness_values.append(peak_stiffness)
+            if pos_peak is not None and neg_peak is not None:
+                # 使用正向峰值点和负向峰值点 (disp, force)
+                points[i] = (pos_peak[0], neg_peak[0], pos_peak[1], neg_peak[1])
+                has_peaks[i] = True
             else:
                 # 如果没有峰值点信息，回退到使用最大和最小位移点的方法
-                # 查找最大和最小位移点
                 max_disp_idx = np.argmax(cycle_disp)
                 min_disp_idx = np.argmin(cycle_disp)
-                
-                # 计算等效刚度
-                disp_diff = cycle_disp[max_disp_idx] - cycle_disp[min_disp_idx]
-                force_diff = cycle_force[max_disp_idx] - cycle_force[min_disp_idx]
-                
-                if abs(disp_diff) > 1e-10:
-                    fallback_stiffness = force_diff / disp_diff
-                else:
-                    fallback_stiffness = 0
-                
-                # 记录结果
-                cycle_stiffness[cycle_num] = {
-                    'equivalent': fallback_stiffness,
-                    'max_disp': cycle_disp[max_disp_idx],
-                    'min_disp': cycle_disp[min_disp_idx],
-                    'max_disp_force': cycle_force[max_disp_idx],
-                    'min_disp_force': cycle_force[min_disp_idx],
-                    'anomaly': anomaly,
-                    'note': '使用最大最小位移点计算（无峰值点）'
-                }
-                
-                # 只有非异常值才计入平均
-                if not anomaly and fallback_stiffness != 0:
-                    cycle_stiffness_values.append(fallback_stiffness)
+                points[i] = (cycle_disp[max_disp_idx], cycle_disp[min_disp_idx],
+                             cycle_force[max_disp_idx], cycle_force[min_disp_idx])
+        
+        # 一次性计算所有循环的等效刚度 (F_max - F_min) / (Disp_max - Disp_min)
+        disp_diff = points[:, 0] - points[:, 1]
+        force_diff = points[:, 2] - points[:, 3]
+        valid = np.abs(disp_diff) > 1e-10  # 避免除以接近零的数
+        stiffness = np.divide(force_diff, disp_diff, out=np.zeros(n), where=valid)
+        
+        # 记录刚度信息
+        cycle_stiffness = {}
+        for cycle_num, k, (max_disp, min_disp, max_force, min_force), is_anomaly, peak in zip(
+                cycle_nums, stiffness.tolist(), points.tolist(), anomaly.tolist(), has_peaks.tolist()):
+            cycle_stiffness[cycle_num] = {
+                'equivalent': k,
+                'max_disp': max_disp,
+                'min_disp': min_disp,
+                'max_disp_force': max_force,
+                'min_disp_force': min_force,
+                'anomaly': is_anomaly
+            }
+            if not peak:
+                cycle_stiffness[cycle_num]['note'] = '使用最大最小位移点计算（无峰值点）'
+        
+        # 只有非异常值才计入平均
+        cycle_stiffness_values = stiffness[~anomaly & (stiffness != 0)]
         
         # 计算平均刚度
-        avg_stiffness = np.mean(cycle_stiffness_values) if cycle_stiffness_values else 0
+        avg_stiffness = float(cycle_stiffness_values.mean()) if cycle_stiffness_values.size else 0
         
         # 计算累积刚度退化（每3个循环计算移动平均值）
         cumulative_stiffness = []
-        if len(cycle_stiffness_values) >= 3:
-            window_size = 3
-            for i in range(len(cycle_stiffness_values) - window_size + 1):
-                window_avg = np.mean(cycle_stiffness_values[i:i+window_size])
-                cumulative_stiffness.append((i+window_size, window_avg))
+        window_size = 3
+        if cycle_stiffness_values.size >= window_size:
+            window_avg = np.convolve(cycle_stiffness_values, np.ones(window_size) / window_size, mode='valid')
+            cumulative_stiffness = [(i + window_size, v) for i, v in enumerate(window_avg.tolist())]
         
         return cycle_stiffness, avg_stiffness, cumulative_stiffness, None
     except Exception as e:
@@ -185,7 +527,6 @@ def generate_skeleton_curve_improved(cycles, cycle_features):
         tuple: (skeleton_disp, skeleton_force, error_message)
     """
     try:
-        skeleton_points = []
         positive_points = []  # 正峰值点列表
         negative_points = []  # 负峰值点列表
         
@@ -201,37 +542,25 @@ def generate_skeleton_curve_improved(cycles, cycle_features):
                 if not features.get('anomaly', False):  # 排除标记为异常的点
                     negative_points.append(features['negative_peak'])
         
-        # 添加原点作为起始点
-        origin_point = (0.0, 0.0)
-        skeleton_points.append(origin_point)
-        
         # 按照位移值从小到大排序负峰值点和正峰值点
-        negative_points.sort(key=lambda p: p[0])
-        positive_points.sort(key=lambda p: p[0])
-        
-        # 添加所有负峰值点（从小到大）
-        for point in negative_points:
-            # 使用3位小数精度判断是否已存在相似点
-            rounded_point = (round(point[0], 3), round(point[1], 3))
-            existing_rounded = [(round(p[0], 3), round(p[1], 3)) for p in skeleton_points]
-            if rounded_point not in existing_rounded:
-                skeleton_points.append(point)
-        
-        # 添加所有正峰值点（从小到大）
-        for point in positive_points:
-            # 使用3位小数精度判断是否已存在相似点
-            rounded_point = (round(point[0], 3), round(point[1], 3))
-            existing_rounded = [(round(p[0], 3), round(p[1], 3)) for p in skeleton_points]
-            if rounded_point not in existing_rounded:
-                skeleton_points.append(point)
-                
+        negative = np.array(negative_points, dtype=np.float64).reshape(-1, 2)
+        positive = np.array(positive_points, dtype=np.float64).reshape(-1, 2)
+        negative = negative[np.argsort(negative[:, 0], kind='stable')]
+        positive = positive[np.argsort(positive[:, 0], kind='stable')]
+        
+        # 依次为原点、负峰值点、正峰值点
+        points = np.vstack(([[0.0, 0.0]], negative, positive))
+        
+        # 使用3位小数精度判断相似点，只保留最先出现的一个
+        _, first = np.unique(np.round(points, 3), axis=0, return_index=True)
+        points = points[np.sort(first)]
+        
         # 按照位移大小排序确保曲线平滑
-        skeleton_points.sort(key=lambda x: x[0])
+        points = points[np.argsort(points[:, 0], kind='stable')]
         
         # 检查是否有足够的点生成骨架曲线
-        if len(skeleton_points) >= 2:
-            skeleton_disp, skeleton_force = zip(*skeleton_points)
-            return np.array(skeleton_disp), np.array(skeleton_force), None
+        if len(points) >= 2:
+            return points[:, 0].copy(), points[:, 1].copy(), None
         else:
             return np.array([]), np.array([]), "点数不足，无法生成有效的骨架曲线"
     except Exception as e:
@@ -335,13 +664,199 @@ def identify_cycles(displacement, force, cycle_count, prominence=0.1):
     except Exception as e:
         return {}, f"循环识别过程中出错: {str(e)}"
 
+@njit(cache=True, nogil=True)
+def _find_turning_points(displacement, start_level, reversal):
+    """按加载方向变化查找位移转折点（极大值和极小值交替出现）
+
+    从第一个绝对值达到start_level的点开始，记录当前方向上的极值点，
+    当位移从该极值反向变化超过reversal时，确认其为转折点。
+    编译后执行时释放GIL，多个线程可同时处理不同工况
+
+    参数:
+        displacement (ndarray): 位移数据
+        start_level (float): 开始识别的位移绝对值
+        reversal (float): 确认转折所需的反向位移量
+
+    返回:
+        ndarray: 转折点索引
+    """
+    n = displacement.shape[0]
+    points = np.empty(n, dtype=np.int64)
+    count = 0
+
+    start = 0
+    while start < n and abs(displacement[start]) < start_level:
+        start += 1
+    if start >= n:
+        return points[:0]
+
+    extreme = start
+    direction = 1 if displacement[start] > 0 else -1
+    for i in range(start + 1, n):
+        value = displacement[i]
+        if direction > 0:
+            if value > displacement[extreme]:
+                extreme = i
+            elif displacement[extreme] - value >= reversal:
+                points[count] = extreme
+                count += 1
+                direction = -1
+                extreme = i
+        else:
+            if value < displacement[extreme]:
+                extreme = i
+            elif value - displacement[extreme] >= reversal:
+                points[count] = extreme
+                count += 1
+                direction = 1
+                extreme = i
+
+    points[count] = extreme
+    count += 1
+    return points[:count]
+
+def _segment_argextrema(values, starts, ends):
+    """一次求出多个区间内最大值和最小值的位置
+
+    区间为闭区间[start, end]，相邻区间可以共用端点。先将各区间的下标拼接后取值，
+    再用reduceat分段求最值，并取每段中第一个等于最值的位置，与np.argmax一致
+
+    参数:
+        values (ndarray): 不含NaN的数据
+        starts (ndarray): 各区间起点
+        ends (ndarray): 各区间终点（包含）
+
+    返回:
+        tuple: (max_idx, min_idx)，均为values中的绝对下标
+    """
+    lengths = ends - starts + 1
+    offsets = np.cumsum(lengths) - lengths
+    flat = np.repeat(starts - offsets, lengths) + np.arange(lengths.sum())
+    gathered = values[flat]
+
+    result = []
+    for reduce in (np.maximum, np.minimum):
+        extrema = reduce.reduceat(gathered, offsets)
+        hits = np.flatnonzero(gathered == np.repeat(extrema, lengths))
+        result.append(flat[hits[np.searchsorted(hits, offsets)]])
+    return tuple(result)
+
+def identify_cycles_by_direction(displacement, force, cycle_count=3, min_prominence=0.1, start_threshold=0.05):
+    """按加载方向变化识别循环
+
+    相邻两个正向峰值点之间的数据作为一个循环，循环内的最小位移点为负向峰值点；
+    未找到足够的转折点时，将数据等分为cycle_count个循环
+
+    参数:
+        displacement (ndarray): 位移数据
+        force (ndarray): 力数据
+        cycle_count (int): 等分时的循环数
+        min_prominence (float): 确认转折所需的反向位移量，占最大位移绝对值的比例
+        start_threshold (float): 开始识别的位移，占最大位移绝对值的比例
+
+    返回:
+        tuple: (cycles_dict, cycle_table, error_message)，各循环数据为输入数组的视图，
+        cycle_table为CYCLE_TABLE_DTYPE结构化数组，失败时为None
+    """
+    try:
+        # 输入已是有限浮点数时直接使用，循环数据与输入数组共享内存
+        displacement = np.asarray(displacement)
+        force = np.asarray(force)
+        if displacement.dtype.kind != 'f':
+            displacement = displacement.astype(np.float64)
+        if force.dtype.kind != 'f':
+            force = force.astype(np.float64)
+        if not (np.isfinite(displacement).all() and np.isfinite(force).all()):
+            displacement = np.nan_to_num(displacement)
+            force = np.nan_to_num(force)
+
+        if len(displacement) < 10:
+            return {}, None, "数据点数量过少，无法识别循环"
+
+        abs_max = np.max(np.abs(displacement))
+        if abs_max == 0:
+            return {}, None, "位移数据全为零，无法识别循环"
+
+        points = _find_turning_points(displacement, start_threshold * abs_max, min_prominence * abs_max)
+
+        # 转折点交替出现，位移大于下一个转折点的为正向峰值点
+        if len(points) > 1:
+            is_max = np.empty(len(points), dtype=bool)
+            is_max[:-1] = displacement[points[:-1]] > displacement[points[1:]]
+            is_max[-1] = not is_max[-2]
+            bounds = points[is_max]
+        else:
+            bounds = points
+
+        if len(bounds) < 2:
+            # 转折点不足时等分数据
+            step = len(displacement) // max(cycle_count, 1)
+            bounds = np.arange(cycle_count + 1) * step
+            bounds[-1] = len(displacement) - 1
+
+        starts = np.asarray(bounds[:-1], dtype=np.intp)
+        ends = np.asarray(bounds[1:], dtype=np.intp)
+        keep = ends - starts > 5  # 至少需要6个点才能形成有意义的循环
+        starts, ends = starts[keep], ends[keep]
+
+        if len(starts) == 0:
+            return {}, None, "无法识别有效的循环，请调整参数后重试"
+
+        # 所有循环共用同一位移数组，一次求出各循环的正负峰值点位置，按列写入特征点表
+        max_idx, min_idx = _segment_argextrema(displacement, starts, ends)
+
+        cycle_table = np.empty(len(starts), dtype=CYCLE_TABLE_DTYPE)
+        cycle_table['cycle'] = np.arange(1, len(starts) + 1)
+        cycle_table['pos_disp'] = displacement[max_idx]
+        cycle_table['pos_force'] = force[max_idx]
+        cycle_table['neg_disp'] = displacement[min_idx]
+        cycle_table['neg_force'] = force[min_idx]
+        # 未跨越零位移的循环视为异常
+        cycle_table['anomaly'] = (cycle_table['pos_disp'] <= 0) | (cycle_table['neg_disp'] >= 0)
+        cycle_table['start'] = starts
+        cycle_table['end'] = ends + 1
+
+        cycles = {
+            cycle_num: (displacement[start_idx:end_idx], force[start_idx:end_idx])
+            for cycle_num, start_idx, end_idx in zip(
+                cycle_table['cycle'].tolist(), cycle_table['start'].tolist(), cycle_table['end'].tolist())
+        }
+
+        return cycles, cycle_table, None
+    except Exception as e:
+        return {}, None, f"循环识别过程中出错: {str(e)}"
+
+def cycle_features_from_table(cycle_table):
+    """由循环特征点表生成按循环编号索引的特征字典，供按字典读取特征的函数使用
+
+    参数:
+        cycle_table (ndarray): CYCLE_TABLE_DTYPE结构化数组
+
+    返回:
+        dict: {循环编号: {'positive_peak', 'negative_peak', 'anomaly', 'bounds'}}，缺失的峰值点为None
+    """
+    cycle_features = {}
+    if cycle_table is None:
+        return cycle_features
+    for cycle_num, pos_disp, pos_force, neg_disp, neg_force, anomaly, start, end in cycle_table.tolist():
+        cycle_features[cycle_num] = {
+            'positive_peak': None if pos_disp != pos_disp else (pos_disp, pos_force),
+            'negative_peak': None if neg_disp != neg_disp else (neg_disp, neg_force),
+            'anomaly': anomaly,
+            'bounds': (start, end)
+        }
+    return cycle_features
+
 def generate_skeleton_curve(cycle_data):
     """生成骨架曲线"""
     try:
         if not cycle_data:
             return np.array([]), np.array([]), "没有循环数据"
             
-        skeleton_points = []
+        # 每个循环最多两个点，预先分配数组
+        skeleton_disp = np.empty(2 * len(cycle_data), dtype=np.float64)
+        skeleton_force = np.empty_like(skeleton_disp)
+        count = 0
         
         for cycle_num, (cycle_disp, cycle_force) in cycle_data.items():
             # 确保数据有效
@@ -349,18 +864,18 @@ def generate_skeleton_curve(cycle_data):
                 continue
                 
             # 找出力的最大和最小点
-            max_idx = np.argmax(cycle_force)
-            min_idx = np.argmin(cycle_force)
+            max_idx = int(np.argmax(cycle_force))
+            min_idx = int(np.argmin(cycle_force))
             
             # 添加到骨架曲线点集
-            skeleton_points.append((cycle_disp[max_idx], cycle_force[max_idx]))
-            skeleton_points.append((cycle_disp[min_idx], cycle_force[min_idx]))
+            skeleton_disp[count], skeleton_force[count] = cycle_disp[max_idx], cycle_force[max_idx]
+            skeleton_disp[count + 1], skeleton_force[count + 1] = cycle_disp[min_idx], cycle_force[min_idx]
+            count += 2
         
         # 按位移排序
-        if skeleton_points:
-            skeleton_points.sort(key=lambda x: x[0])
-            skeleton_disp, skeleton_force = zip(*skeleton_points)
-            return np.array(skeleton_disp), np.array(skeleton_force), None
+        if count:
+            order = np.argsort(skeleton_disp[:count], kind='stable')
+            return skeleton_disp[order], skeleton_force[order], None
         else:
             return np.array([]), np.array([]), "无法生成骨架曲线点"
     except Exception as e:
@@ -470,8 +985,57 @@ def debug_plot_stiffness_degradation(cumulative_stiffness, title="刚度退化
 # ==================== 能量耗散与滞回特性函数 ====================
 
 def calculate_energy_dissipation(displacement, force):
-    # 实现计算能量耗散的逻辑
-    pass
+    """计算单个循环的耗能（滞回环所围面积）
+
+    参数:
+        displacement (ndarray): 循环位移数据
+        force (ndarray): 循环力数据
+
+    返回:
+        float: 耗能
+    """
+    displacement = np.asarray(displacement, dtype=np.float64)
+    force = np.asarray(force, dtype=np.float64)
+    if len(displacement) < 2:
+        return 0.0
+    # 梯形积分，最后一点与起点相连使滞回环闭合
+    next_disp = np.roll(displacement, -1)
+    next_force = np.roll(force, -1)
+    return float(abs(np.dot(force + next_force, next_disp - displacement)) * 0.5)
+
+@njit(cache=True, nogil=True)
+def _argminmax_kernel(values):
+    """单次遍历同时求最小值和最大值的位置"""
+    min_idx = 0
+    max_idx = 0
+    min_val = values[0]
+    max_val = values[0]
+    for i in range(1, len(values)):
+        v = values[i]
+        if v < min_val:
+            min_val = v
+            min_idx = i
+        elif v > max_val:
+            max_val = v
+            max_idx = i
+    return min_idx, max_idx
+
+def argminmax(values):
+    """求数组最小值和最大值的位置
+    
+    安装numba时单次遍历同时求出，否则分别调用np.argmin和np.argmax；
+    相同最值取第一个位置，与np.argmin/np.argmax一致
+
+    参数:
+        values (ndarray): 不含NaN的一维数据
+
+    返回:
+        tuple: (min_idx, max_idx)
+    """
+    values = np.asarray(values)
+    if NUMBA_AVAILABLE:
+        return _argminmax_kernel(values)
+    return int(np.argmin(values)), int(np.argmax(values))
 
 # ==================== 其他辅助计算函数 ====================
 